@@ -22,24 +22,175 @@ import sys
 import json
 import logging
 import argparse
+import concurrent.futures
+import itertools
+import queue
+import threading
 from datetime import datetime
 from typing import Dict, List, Any
-import traceback
 
 # Add src directory to path
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'src'))
 
+# Import orjson for fast JSON serialization (falls back to stdlib json)
+try:
+    import orjson
+    ORJSON_SUPPORT = True
+except ImportError:
+    ORJSON_SUPPORT = False
+
+# Import ijson for streaming JSON parsing (falls back to json.load)
+try:
+    import ijson
+    IJSON_SUPPORT = True
+except ImportError:
+    IJSON_SUPPORT = False
+
 from email_file_reader import EmailFileReader
 from progress_tracker import ProgressTracker
 from batch_uploader import BatchUploader
 from newsletter_parser_deterministic import DeterministicNewsletterParser
 from entity_extractor import EntityExtractor
 from validation_orchestrator import ValidationOrchestrator
-from article_preparator import ArticlePreparator
+from article_preparator import ArticlePreparator, PreparedArticle
 from dealcloud_uploader import DealCloudUploader
 from report_generator import ReportGenerator
 
 
+def _available_cpus():
+    """CPUs actually available to this process, not the machine total.
+
+    Under containers or CPU affinity masks os.cpu_count() overstates the
+    usable cores, which oversubscribes the pool and thrashes caches.
+    """
+    try:
+        return len(os.sched_getaffinity(0)) or 1
+    except AttributeError:
+        return os.cpu_count() or 1
+
+
+def _dumps_article(article) -> bytes:
+    """
+    Serialize a single article (PreparedArticle or dict) to JSON bytes.
+
+    Compact form, one article per line: the output is machine-consumed by
+    upload_phase, so pretty-printing would only inflate write bandwidth.
+    """
+    if isinstance(article, PreparedArticle):
+        article = article.to_dict()
+    if ORJSON_SUPPORT:
+        return orjson.dumps(article, option=orjson.OPT_NON_STR_KEYS)
+    return json.dumps(article, ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+
+
+# Per-process pipeline components, created once per worker by _init_worker
+_worker_components = {}
+
+# Marks the end of the prefetch queue
+_PREFETCH_SENTINEL = object()
+
+
+def _prefetch_files(reader, file_paths, out_queue):
+    """
+    Read email files ahead of the parser and push them onto a bounded queue.
+
+    Runs on a background thread so disk I/O overlaps with CPU-bound parsing.
+
+    Args:
+        reader: EmailFileReader instance
+        file_paths: Iterable of file paths to read
+        out_queue: Bounded queue.Queue receiving (path, email_data, error)
+    """
+    for file_path in file_paths:
+        try:
+            out_queue.put((file_path, reader.read_email_file(file_path), None))
+        except Exception as e:
+            out_queue.put((file_path, None, str(e)))
+
+    out_queue.put(_PREFETCH_SENTINEL)
+
+
+def _init_worker(article_type: str, entity_batch_size: int):
+    """
+    Initialize pipeline components once per worker process.
+
+    Args:
+        article_type: Article type passed to ArticlePreparator
+        entity_batch_size: Articles per entity extraction batch
+    """
+    logger = logging.getLogger('bulk_processor')
+    _worker_components['reader'] = EmailFileReader(logger=logger)
+    _worker_components['parser'] = DeterministicNewsletterParser(logger=logger)
+    _worker_components['extractor'] = EntityExtractor(logger=logger)
+    _worker_components['validator'] = ValidationOrchestrator(logger=logger)
+    _worker_components['preparator'] = ArticlePreparator(article_type=article_type, logger=logger)
+    _worker_components['entity_batch_size'] = entity_batch_size
+
+
+def _process_one(file_path: str):
+    """
+    Run read -> parse -> extract -> validate -> prepare for a single file.
+
+    Module-level so it is picklable for ProcessPoolExecutor dispatch.
+
+    Args:
+        file_path: Path to the .eml/.msg file
+
+    Returns:
+        Tuple of (file_path, prepared_articles, error). On success error is
+        None; on failure prepared_articles is None and error holds the message.
+    """
+    try:
+        email_data = _worker_components['reader'].read_email_file(file_path)
+    except Exception as e:
+        return (file_path, None, str(e))
+
+    return _process_email_data(file_path, email_data)
+
+
+def _process_email_data(file_path: str, email_data):
+    """
+    Parse, extract, validate and prepare already-read email data.
+
+    Args:
+        file_path: Path the email was read from (for error reporting)
+        email_data: Tuple of (from_, subject, date, body_text, body_html)
+
+    Returns:
+        Tuple of (file_path, prepared_articles, error) as in _process_one
+    """
+    components = _worker_components
+    from_, subject, date, body_text, body_html = email_data
+
+    try:
+        articles = components['parser'].parse_newsletter(from_, subject, date, body_text, body_html)
+
+        if not articles:
+            return (file_path, [], None)
+
+        articles_with_entities = components['extractor'].extract_from_articles_batched(
+            articles,
+            batch_size=components['entity_batch_size']
+        )
+
+        validated_articles = components['validator'].validate_articles(articles_with_entities)
+
+        # Stamp source metadata and prepare for DealCloud in a single pass
+        # over the validated articles
+        preparator = components['preparator']
+        prepared_articles = []
+        for article in validated_articles:
+            article['source_subject'] = subject
+            article['source_date'] = date
+            article['source_from'] = from_
+            prepared_articles.append(preparator.prepare_article(article))
+
+        return (file_path, prepared_articles, None)
+
+    except Exception as e:
+        return (file_path, None, str(e))
+
+
 class BulkEmailProcessor:
     """Orchestrates bulk email processing in two phases."""
 
@@ -50,7 +201,11 @@ class BulkEmailProcessor:
     MAX_RETRIES = 3                   # Retry attempts per batch
     PARSE_BATCH_SIZE = 100            # Emails per memory batch
     ENTITY_BATCH_SIZE = 10            # Articles per entity extraction batch
-    CHECKPOINT_SAVE_INTERVAL = 10     # Save checkpoint every N files
+    CHECKPOINT_SAVE_INTERVAL = 10     # Journal processed files every N files
+    CHECKPOINT_SNAPSHOT_INTERVAL = 10000  # Full checkpoint rewrite every N files
+    PARSE_WORKERS = _available_cpus()  # Worker processes for parse phase
+    PARSE_CHUNKSIZE = 16              # Files per task chunk in the worker pool
+    PREFETCH_DEPTH = 32               # Emails read ahead of the parser
 
     def __init__(self, logger=None):
         """
@@ -88,7 +243,8 @@ class BulkEmailProcessor:
         output_path: str,
         checkpoint_path: str,
         resume: bool = False,
-        limit: int = None
+        limit: int = None,
+        workers: int = None
     ) -> Dict[str, Any]:
         """
         Phase 1: Parse .eml files and save articles to JSON.
@@ -99,6 +255,7 @@ class BulkEmailProcessor:
             checkpoint_path: Path to checkpoint file
             resume: Resume from checkpoint
             limit: Maximum emails to process (for testing)
+            workers: Worker processes for parsing (default: CPU count)
 
         Returns:
             Statistics dict
@@ -108,13 +265,13 @@ class BulkEmailProcessor:
         self.logger.info("PHASE 1: PARSE EMAILS AND EXTRACT ENTITIES")
         self.logger.info("=" * 70)
 
-        # Initialize components
+        if workers is None:
+            workers = self.PARSE_WORKERS
+
+        # Initialize components (parse/extract/validate components are created
+        # per worker process by _init_worker)
         reader = EmailFileReader(logger=self.logger)
         tracker = ProgressTracker(checkpoint_path, logger=self.logger)
-        parser = DeterministicNewsletterParser(logger=self.logger)
-        extractor = EntityExtractor(logger=self.logger)
-        validator = ValidationOrchestrator(logger=self.logger)
-        preparator = ArticlePreparator(article_type=self.ARTICLE_TYPE, logger=self.logger)
 
         # Load checkpoint if resuming
         if resume:
@@ -123,12 +280,15 @@ class BulkEmailProcessor:
             tracker.reset()
 
         # Scan folder for .eml files
-        self.logger.info(f"Scanning folder: {folder_path}")
-        all_files = reader.scan_folder(folder_path)
+        self.logger.info("Scanning folder: %s", folder_path)
 
         if limit:
-            all_files = all_files[:limit]
-            self.logger.info(f"Limited to {limit} files")
+            # Stop scanning as soon as enough files are found instead of
+            # enumerating the whole folder
+            all_files = sorted(itertools.islice(reader.iter_folder(folder_path), limit))
+            self.logger.info("Limited to %d files", limit)
+        else:
+            all_files = reader.scan_folder(folder_path)
 
         # Filter out already processed files
         remaining_files = tracker.get_remaining_files(all_files) if resume else all_files
@@ -140,7 +300,7 @@ class BulkEmailProcessor:
             self.logger.info("No files to process")
             return self._generate_parse_stats(tracker, start_time, output_path, checkpoint_path)
 
-        self.logger.info(f"Processing {len(remaining_files)} files...")
+        self.logger.info("Processing %d files...", len(remaining_files))
 
         # Create or append to output file
         output_mode = 'a' if resume and os.path.exists(output_path) else 'w'
@@ -148,109 +308,160 @@ class BulkEmailProcessor:
 
         # Track statistics
         total_articles = 0
-        total_entities = {'hotels': 0, 'companies': 0, 'contacts': 0}
-        total_matched = {'hotels': 0, 'companies': 0, 'contacts': 0}
+        # Function-local int accumulators are cheaper than per-article dict
+        # key hashing; values are flushed into checkpoint statistics in bulk
+        total_hotels = 0
+        total_companies = 0
+        total_contacts = 0
         files_processed = 0
+        pending_processed = []  # Paths processed since the last journal write
 
         # Process files in batches (for memory management)
-        with open(output_path, output_mode, encoding='utf-8') as out_file:
+        # Binary mode with a large buffer so serialized articles are written directly
+        with open(output_path, output_mode + 'b', buffering=1 << 20) as out_file:
             # If starting fresh, write opening bracket
             if output_mode == 'w':
-                out_file.write('[\n')
-
-            for i, file_path in enumerate(remaining_files):
-                try:
-                    # Read email (supports both .eml and .msg)
-                    from_, subject, date, body_text, body_html = reader.read_email_file(file_path)
-
-                    # Parse newsletter (pass all parameters)
-                    articles = parser.parse_newsletter(from_, subject, date, body_text, body_html)
-
-                    if not articles:
-                        self.logger.warning(f"No articles extracted from {os.path.basename(file_path)}")
-                        tracker.mark_processed(file_path)
-                        continue
-
-                    # Extract entities in batches
-                    articles_with_entities = extractor.extract_from_articles_batched(
-                        articles,
-                        batch_size=self.ENTITY_BATCH_SIZE
-                    )
-
-                    # Validate entities
-                    validated_articles = validator.validate_articles(articles_with_entities)
-
-                    # Add source metadata to articles
-                    for article in validated_articles:
-                        article['source_subject'] = subject
-                        article['source_date'] = date
-                        article['source_from'] = from_
-
-                    # Prepare for DealCloud
-                    prepared_articles = preparator.prepare_articles(validated_articles)
-
-                    # Write articles to JSON (append mode)
-                    for article in prepared_articles:
-                        # Add comma if not first article
-                        if total_articles > 0 or output_mode == 'a':
-                            out_file.write(',\n')
-
-                        json.dump(article, out_file, indent=2, ensure_ascii=False)
-                        total_articles += 1
-
-                        # Track entity stats
-                        if article.get('Hotels'):
-                            total_entities['hotels'] += len(article['Hotels'])
-                        if article.get('Companies'):
-                            total_entities['companies'] += len(article['Companies'])
-                        if article.get('Contacts'):
-                            total_entities['contacts'] += len(article['Contacts'])
-
-                    # Mark as processed
+                out_file.write(b'[\n')
+
+            # When appending, the file already contains articles, so the first
+            # write needs a separator
+            first_article = output_mode == 'w'
+
+            # Process files (pool of workers, or in-process when workers == 1),
+            # consuming results in order so JSON writes and checkpoints stay
+            # consistent
+            if workers > 1:
+                results = self._parse_files_parallel(remaining_files, workers)
+            else:
+                results = self._parse_files_sequential(remaining_files)
+
+            for file_path, prepared_articles, error in results:
+                if error is not None:
+                    self.logger.error("Error processing %s: %s", file_path, error)
+                    tracker.mark_failed(file_path, error)
+                    continue
+
+                if not prepared_articles:
+                    self.logger.warning("No articles extracted from %s", os.path.basename(file_path))
                     tracker.mark_processed(file_path)
-                    files_processed += 1
-
-                    # Save checkpoint periodically
-                    if files_processed % self.CHECKPOINT_SAVE_INTERVAL == 0:
-                        tracker.update_statistics({
-                            'emails_read': files_processed,
-                            'articles_extracted': total_articles,
-                            'hotels_extracted': total_entities['hotels'],
-                            'companies_extracted': total_entities['companies'],
-                            'contacts_extracted': total_entities['contacts']
-                        })
-                        tracker.save_checkpoint()
-                        self.logger.info(f"Progress: {files_processed}/{len(remaining_files)} files, {total_articles} articles")
-
-                except Exception as e:
-                    self.logger.error(f"Error processing {file_path}: {e}")
-                    self.logger.debug(traceback.format_exc())
-                    tracker.mark_failed(file_path, str(e))
+                    pending_processed.append(file_path)
                     continue
 
+                # Write articles to JSON (append mode)
+                for article in prepared_articles:
+                    # Add comma if not first article
+                    if first_article:
+                        first_article = False
+                    else:
+                        out_file.write(b',\n')
+
+                    out_file.write(_dumps_article(article))
+                    total_articles += 1
+
+                    # Track entity stats; the preparator always emits these
+                    # keys as lists, so index directly
+                    total_hotels += len(article['Hotels'])
+                    total_companies += len(article['Companies'])
+                    total_contacts += len(article['Contacts'])
+
+                # Mark as processed
+                tracker.mark_processed(file_path)
+                pending_processed.append(file_path)
+                files_processed += 1
+
+                # Journal processed paths periodically (append-only, avoids
+                # rewriting the whole checkpoint on every save)
+                if files_processed % self.CHECKPOINT_SAVE_INTERVAL == 0:
+                    tracker.update_statistics({
+                        'emails_read': files_processed,
+                        'articles_extracted': total_articles,
+                        'hotels_extracted': total_hotels,
+                        'companies_extracted': total_companies,
+                        'contacts_extracted': total_contacts
+                    })
+                    tracker.append_processed_batch(pending_processed)
+                    pending_processed.clear()
+                    self.logger.info("Progress: %d/%d files, %d articles", files_processed, len(remaining_files), total_articles)
+
+                # Compact the journal into a full snapshot occasionally
+                if files_processed % self.CHECKPOINT_SNAPSHOT_INTERVAL == 0:
+                    tracker.save_checkpoint()
+
             # Close JSON array
-            out_file.write('\n]\n')
+            out_file.write(b'\n]\n')
 
         # Final checkpoint save
         tracker.update_statistics({
             'emails_read': files_processed,
             'articles_extracted': total_articles,
-            'hotels_extracted': total_entities['hotels'],
-            'companies_extracted': total_entities['companies'],
-            'contacts_extracted': total_entities['contacts']
+            'hotels_extracted': total_hotels,
+            'companies_extracted': total_companies,
+            'contacts_extracted': total_contacts
         })
         tracker.save_checkpoint()
 
         end_time = datetime.now()
         self.logger.info("=" * 70)
         self.logger.info("PARSE PHASE COMPLETE")
-        self.logger.info(f"Processed: {files_processed} files")
-        self.logger.info(f"Extracted: {total_articles} articles")
-        self.logger.info(f"Output: {output_path}")
+        self.logger.info("Processed: %d files", files_processed)
+        self.logger.info("Extracted: %d articles", total_articles)
+        self.logger.info("Output: %s", output_path)
         self.logger.info("=" * 70)
 
         return self._generate_parse_stats(tracker, start_time, output_path, checkpoint_path, end_time)
 
+    def _parse_files_sequential(self, remaining_files):
+        """
+        Process files one at a time in this process, yielding result tuples.
+
+        File reads are prefetched by a background thread through a bounded
+        queue so disk I/O overlaps with CPU-bound parsing.
+
+        Args:
+            remaining_files: List of file paths to process
+
+        Yields:
+            Tuples of (file_path, prepared_articles, error)
+        """
+        _init_worker(self.ARTICLE_TYPE, self.ENTITY_BATCH_SIZE)
+
+        prefetch_queue = queue.Queue(maxsize=self.PREFETCH_DEPTH)
+        prefetcher = threading.Thread(
+            target=_prefetch_files,
+            args=(_worker_components['reader'], remaining_files, prefetch_queue),
+            daemon=True
+        )
+        prefetcher.start()
+
+        while (item := prefetch_queue.get()) is not _PREFETCH_SENTINEL:
+            file_path, email_data, error = item
+
+            if error is not None:
+                yield (file_path, None, error)
+            else:
+                yield _process_email_data(file_path, email_data)
+
+    def _parse_files_parallel(self, remaining_files, workers):
+        """
+        Process files across a pool of worker processes, yielding result
+        tuples in submission order.
+
+        Args:
+            remaining_files: List of file paths to process
+            workers: Number of worker processes
+
+        Yields:
+            Tuples of (file_path, prepared_articles, error)
+        """
+        self.logger.info("Parsing with %d worker processes", workers)
+
+        with concurrent.futures.ProcessPoolExecutor(
+            max_workers=workers,
+            initializer=_init_worker,
+            initargs=(self.ARTICLE_TYPE, self.ENTITY_BATCH_SIZE)
+        ) as executor:
+            yield from executor.map(_process_one, remaining_files, chunksize=self.PARSE_CHUNKSIZE)
+
     def upload_phase(
         self,
         input_path: str,
@@ -273,18 +484,6 @@ class BulkEmailProcessor:
         self.logger.info("PHASE 2: UPLOAD TO DEALCLOUD")
         self.logger.info("=" * 70)
 
-        # Load articles from JSON
-        self.logger.info(f"Loading articles from {input_path}")
-        try:
-            with open(input_path, 'r', encoding='utf-8') as f:
-                articles = json.load(f)
-        except Exception as e:
-            self.logger.error(f"Failed to load articles: {e}")
-            raise
-
-        total_articles = len(articles)
-        self.logger.info(f"Loaded {total_articles} articles")
-
         # Initialize uploader
         dealcloud_uploader = DealCloudUploader(logger=self.logger)
 
@@ -297,20 +496,36 @@ class BulkEmailProcessor:
             logger=self.logger
         )
 
-        # Upload in batches
-        upload_stats = batch_uploader.upload_in_batches(
-            articles=articles,
-            checkpoint_path=checkpoint_path,
-            resume=resume
-        )
+        # Stream articles from JSON and upload in batches. ijson yields
+        # articles one at a time so memory stays constant regardless of
+        # input size.
+        self.logger.info("Streaming articles from %s", input_path)
+        try:
+            with open(input_path, 'rb') as f:
+                if IJSON_SUPPORT:
+                    articles = ijson.items(f, 'item')
+                else:
+                    articles = json.load(f)
+
+                upload_stats = batch_uploader.upload_in_batches(
+                    articles=articles,
+                    checkpoint_path=checkpoint_path,
+                    resume=resume
+                )
+        except Exception as e:
+            self.logger.error("Failed to load articles: %s", e)
+            raise
+
+        total_articles = upload_stats['total_articles']
+        self.logger.info("Processed %d articles from input", total_articles)
 
         end_time = datetime.now()
         duration = (end_time - start_time).total_seconds()
 
         self.logger.info("=" * 70)
         self.logger.info("UPLOAD PHASE COMPLETE")
-        self.logger.info(f"Uploaded: {upload_stats['uploaded']}/{total_articles} articles")
-        self.logger.info(f"Success Rate: {upload_stats['success_rate']:.1f}%")
+        self.logger.info("Uploaded: %d/%d articles", upload_stats['uploaded'], total_articles)
+        self.logger.info("Success Rate: %.1f%%", upload_stats['success_rate'])
         self.logger.info("=" * 70)
 
         # Add timing info
@@ -383,6 +598,7 @@ def main():
     parse_parser.add_argument('--checkpoint', default='data/bulk_checkpoint.json', help='Checkpoint file path')
     parse_parser.add_argument('--resume', action='store_true', help='Resume from checkpoint')
     parse_parser.add_argument('--limit', type=int, help='Maximum emails to process (for testing)')
+    parse_parser.add_argument('--workers', type=int, help='Worker processes for parsing (default: CPU count)')
 
     # Upload phase
     upload_parser = subparsers.add_parser('upload', help='Upload previously parsed articles')
@@ -413,7 +629,8 @@ def main():
                 output_path=args.output,
                 checkpoint_path=args.checkpoint,
                 resume=args.resume,
-                limit=args.limit
+                limit=args.limit,
+                workers=args.workers
             )
 
             # Generate report
@@ -441,8 +658,8 @@ def main():
         print("Run with --resume to continue from where you left off.")
         sys.exit(1)
     except Exception as e:
-        processor.logger.error(f"Fatal error: {e}")
-        processor.logger.error(traceback.format_exc())
+        # exc_info defers stack formatting until a handler actually emits
+        processor.logger.error("Fatal error: %s", e, exc_info=True)
         sys.exit(1)
 
 
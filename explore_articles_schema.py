@@ -5,28 +5,96 @@ DealCloud Articles Schema Explorer
 Retrieves detailed schema and fields for the Articles object.
 
 Usage:
-    python explore_articles_schema.py [--object-name OBJECT_NAME]
+    python explore_articles_schema.py [--object-name OBJECT_NAME] [--refresh]
 
 Arguments:
     --object-name: Name of the object to explore (default: "Articles")
+    --refresh: Force a fresh retrieval even if a recent cached schema exists
 """
 
 import json
 import os
 import sys
+import time
 import argparse
+import functools
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime
+from types import SimpleNamespace
 
 # Add src to path
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'src'))
 
 from dealcloud_explorer import get_client, find_object_by_name, get_object_fields, format_field_info, setup_logging
 
+# Schema cache settings: reuse a saved schema if it's fresher than this
+SCHEMA_CACHE_PATH = 'data/articles_schema.json'
+SCHEMA_CACHE_MAX_AGE = 24 * 60 * 60  # 24 hours, in seconds
+
+# Memoize object lookups so repeated calls within a run skip the API
+find_object_by_name = functools.lru_cache(maxsize=None)(find_object_by_name)
+
+# Field type codes are small dense integers, so a tuple indexed by code
+# beats a dict rebuilt per invocation
+_TYPE_CODES = ('', 'Text', 'Choice/Text', 'Number', 'Date/Time', 'Reference', 'Boolean', 'User Reference')
+
+
+def _type_name(code):
+    """Human-readable name for a DealCloud field type code."""
+    if isinstance(code, int) and 0 < code < len(_TYPE_CODES):
+        return _TYPE_CODES[code]
+    return f'Type {code}'
+
+
+def _load_cached_schema(cache_path, object_name, max_age, logger):
+    """
+    Load a previously saved schema if it's fresh enough.
+
+    Args:
+        cache_path: Path to the saved schema JSON
+        object_name: Object name being explored (must match the cached object)
+        max_age: Maximum cache age in seconds
+        logger: Logger instance
+
+    Returns:
+        Tuple of (obj, fields) with attribute access like the SDK models,
+        or None if the cache is missing, stale, or for a different object
+    """
+    try:
+        age = time.time() - os.stat(cache_path).st_mtime
+    except OSError:
+        return None
+
+    if age > max_age:
+        return None
+
+    try:
+        with open(cache_path, 'r', encoding='utf-8') as f:
+            cached = json.load(f)
+
+        obj_dict = cached['object']
+        cached_names = {
+            str(obj_dict.get(key, '')).lower()
+            for key in ('name', 'apiName', 'singularName', 'pluralName')
+        }
+        if object_name.lower() not in cached_names:
+            return None
+
+        obj = SimpleNamespace(**obj_dict)
+        fields = [SimpleNamespace(**field_dict) for field_dict in cached['fields']]
+        logger.info(f"Using cached schema from {cache_path} ({age / 3600:.1f}h old)")
+        return obj, fields
+
+    except Exception as e:
+        logger.warning(f"Failed to load cached schema: {e}")
+        return None
+
 
 def main():
     """Explore Articles object schema in detail."""
     parser = argparse.ArgumentParser(description='Explore DealCloud Articles schema')
     parser.add_argument('--object-name', default='Articles', help='Object name to explore (default: Articles)')
+    parser.add_argument('--refresh', action='store_true', help='Force fresh retrieval, ignoring the cached schema')
     args = parser.parse_args()
 
     logger = setup_logging('explore_articles_schema')
@@ -36,19 +104,27 @@ def main():
     logger.info("=" * 80)
 
     try:
-        # Connect to DealCloud
-        logger.info("Connecting to DealCloud...")
-        dc = get_client()
-        logger.info("Connected successfully!")
-
-        # Find the object
-        logger.info(f"\nSearching for '{args.object_name}' object...")
-        obj = find_object_by_name(dc, args.object_name)
-
-        if not obj:
-            logger.error(f"\n[X] Object '{args.object_name}' not found")
-            logger.error("Run 'python explore_dealcloud_objects.py' to see all available objects")
-            sys.exit(1)
+        # Check the disk cache first to avoid network round-trips entirely
+        cached = None
+        if not args.refresh:
+            cached = _load_cached_schema(SCHEMA_CACHE_PATH, args.object_name, SCHEMA_CACHE_MAX_AGE, logger)
+
+        if cached:
+            obj, fields = cached
+        else:
+            # Connect to DealCloud
+            logger.info("Connecting to DealCloud...")
+            dc = get_client()
+            logger.info("Connected successfully!")
+
+            # Find the object
+            logger.info(f"\nSearching for '{args.object_name}' object...")
+            obj = find_object_by_name(dc, args.object_name)
+
+            if not obj:
+                logger.error(f"\n[X] Object '{args.object_name}' not found")
+                logger.error("Run 'python explore_dealcloud_objects.py' to see all available objects")
+                sys.exit(1)
 
         # Display object info
         obj_id = getattr(obj, 'id', 'N/A')
@@ -65,26 +141,33 @@ def main():
         print(f"Singular: {singular}")
         print(f"Plural: {plural}")
 
-        # Get fields
-        logger.info(f"\nRetrieving fields for '{api_name}'...")
-        try:
-            fields = get_object_fields(dc, api_name)
-        except Exception as e:
-            logger.error(f"Failed to get fields: {str(e)}")
-            logger.info("Trying alternative object names...")
-
-            # Try plural form
-            try:
-                fields = get_object_fields(dc, plural)
-                logger.info(f"Success using plural form: {plural}")
-            except:
-                # Try singular form
-                try:
-                    fields = get_object_fields(dc, singular)
-                    logger.info(f"Success using singular form: {singular}")
-                except:
-                    logger.error("Unable to retrieve fields using any object name variant")
-                    sys.exit(1)
+        if not cached:
+            # Get fields: fire all candidate name variants concurrently and
+            # take the first successful response instead of walking the
+            # api_name -> plural -> singular fallback chain sequentially
+            candidate_names = list(dict.fromkeys(n for n in (api_name, plural, singular) if n))
+            logger.info(f"\nRetrieving fields for '{api_name}'...")
+
+            fields = None
+            with ThreadPoolExecutor(max_workers=len(candidate_names)) as executor:
+                futures = {
+                    executor.submit(get_object_fields, dc, name): name
+                    for name in candidate_names
+                }
+                for future in as_completed(futures):
+                    name = futures[future]
+                    try:
+                        fields = future.result()
+                    except Exception as e:
+                        logger.warning(f"Failed to get fields for '{name}': {str(e)}")
+                        continue
+                    if name != api_name:
+                        logger.info(f"Success using alternative name: {name}")
+                    break
+
+            if fields is None:
+                logger.error("Unable to retrieve fields using any object name variant")
+                sys.exit(1)
 
         logger.info(f"[OK] Found {len(fields)} fields\n")
 
@@ -120,17 +203,6 @@ def main():
         print("SCHEMA COMPARISON")
         print("=" * 80)
 
-        # Type code mapping
-        TYPE_CODES = {
-            1: 'Text',
-            2: 'Choice/Text',
-            3: 'Number',
-            4: 'Date/Time',
-            5: 'Reference',
-            6: 'Boolean',
-            7: 'User Reference'
-        }
-
         missing_fields = []
         matched_fields = []
         extra_fields = []
@@ -141,7 +213,7 @@ def main():
                 matched_fields.append(expected_name)
                 field = found_fields[expected_name]
                 field_type_code = getattr(field, 'fieldType', None) or getattr(field, 'type', 'Unknown')
-                field_type = TYPE_CODES.get(field_type_code, f'Type {field_type_code}')
+                field_type = _type_name(field_type_code)
 
                 print(f"[OK] {expected_name}")
                 print(f"  Expected: {expected_type}")
@@ -187,56 +259,58 @@ def main():
             for field_name in extra_fields:
                 field = found_fields[field_name]
                 field_type_code = getattr(field, 'fieldType', None) or getattr(field, 'type', 'Unknown')
-                field_type = TYPE_CODES.get(field_type_code, f'Type {field_type_code}')
+                field_type = _type_name(field_type_code)
                 print(f"  + {field_name} ({field_type})")
 
-        # Save to JSON
-        os.makedirs('data', exist_ok=True)
-        output_path = 'data/articles_schema.json'
-
-        # Convert Pydantic models to dicts for JSON serialization
-        obj_dict = {
-            'id': getattr(obj, 'id', None),
-            'name': getattr(obj, 'name', None),
-            'apiName': getattr(obj, 'apiName', None),
-            'singularName': getattr(obj, 'singularName', None),
-            'pluralName': getattr(obj, 'pluralName', None)
-        }
+        # Save to JSON (skip when running from cache so the file's
+        # timestamp still reflects when the schema was actually retrieved)
+        if not cached:
+            os.makedirs('data', exist_ok=True)
+            output_path = SCHEMA_CACHE_PATH
+
+            # Convert Pydantic models to dicts for JSON serialization
+            obj_dict = {
+                'id': getattr(obj, 'id', None),
+                'name': getattr(obj, 'name', None),
+                'apiName': getattr(obj, 'apiName', None),
+                'singularName': getattr(obj, 'singularName', None),
+                'pluralName': getattr(obj, 'pluralName', None)
+            }
 
-        fields_dicts = []
-        for field in fields:
-            # Try to convert Pydantic model to dict
-            if hasattr(field, 'model_dump'):
-                field_dict = field.model_dump()
-            elif hasattr(field, 'dict'):
-                field_dict = field.dict()
-            else:
-                # Manual conversion for older versions
-                field_dict = {
-                    'name': getattr(field, 'name', None),
-                    'fieldType': getattr(field, 'fieldType', None),
-                    'isRequired': getattr(field, 'isRequired', None),
-                    'displayName': getattr(field, 'displayName', None)
+            fields_dicts = []
+            for field in fields:
+                # Try to convert Pydantic model to dict
+                if hasattr(field, 'model_dump'):
+                    field_dict = field.model_dump()
+                elif hasattr(field, 'dict'):
+                    field_dict = field.dict()
+                else:
+                    # Manual conversion for older versions
+                    field_dict = {
+                        'name': getattr(field, 'name', None),
+                        'fieldType': getattr(field, 'fieldType', None),
+                        'isRequired': getattr(field, 'isRequired', None),
+                        'displayName': getattr(field, 'displayName', None)
+                    }
+                fields_dicts.append(field_dict)
+
+            output_data = {
+                'retrieved_at': datetime.now().isoformat(),
+                'object': obj_dict,
+                'total_fields': len(fields),
+                'fields': fields_dicts,
+                'comparison': {
+                    'expected_fields': expected_fields,
+                    'matched_fields': matched_fields,
+                    'missing_fields': missing_fields,
+                    'extra_fields': extra_fields
                 }
-            fields_dicts.append(field_dict)
-
-        output_data = {
-            'retrieved_at': datetime.now().isoformat(),
-            'object': obj_dict,
-            'total_fields': len(fields),
-            'fields': fields_dicts,
-            'comparison': {
-                'expected_fields': expected_fields,
-                'matched_fields': matched_fields,
-                'missing_fields': missing_fields,
-                'extra_fields': extra_fields
             }
-        }
 
-        with open(output_path, 'w', encoding='utf-8') as f:
-            json.dump(output_data, f, indent=2, ensure_ascii=False)
+            with open(output_path, 'w', encoding='utf-8') as f:
+                json.dump(output_data, f, indent=2, ensure_ascii=False)
 
-        print(f"\n[OK] Schema saved to: {output_path}")
+            print(f"\n[OK] Schema saved to: {output_path}")
         print("=" * 80)
 
         # Exit with error code if fields are missing
@@ -4,40 +4,51 @@ import csv
 import glob
 import sys
 from datetime import datetime
-
-# Get the most recent articles JSON file
-json_files = sorted(glob.glob('data/articles_*.json'), reverse=True)
-if not json_files:
-    print("No articles JSON files found!")
-    sys.exit(1)
-
-json_file = json_files[0]
-print(f"Reading: {json_file}")
-
-with open(json_file, 'r', encoding='utf-8') as f:
-    data = json.load(f)
-    articles = data['articles']
-
-# Generate output filename
-timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-csv_file = f"data/articles_export_{timestamp}.csv"
-
-# Prepare CSV data
-csv_rows = []
-
-for i, article in enumerate(articles, 1):
-    # Get metadata
-    metadata = article.get('_metadata', {})
+from itertools import islice
+
+# Rows handed to the csv writer per writerows() call
+WRITE_CHUNK_SIZE = 1000
+
+# Import ijson for streaming JSON parsing (falls back to json.load)
+try:
+    import ijson
+    IJSON_SUPPORT = True
+except ImportError:
+    IJSON_SUPPORT = False
+
+FIELDNAMES = [
+    'Article_Number', 'Type', 'Source', 'Headline', 'Article_Text', 'Publish_Date',
+    'Total_Hotels', 'Matched_Hotels', 'Total_Companies', 'Matched_Companies',
+    'Total_Contacts', 'Matched_Contacts',
+    'Hotels_Extracted', 'Hotels_Matched',
+    'Companies_Extracted', 'Companies_Matched',
+    'Contacts_Extracted', 'Contacts_Matched'
+]
+
+# Column indices of the summary counters within a row tuple
+COUNT_COLUMNS = {
+    name: FIELDNAMES.index(name)
+    for name in ('Total_Hotels', 'Matched_Hotels', 'Total_Companies',
+                 'Matched_Companies', 'Total_Contacts', 'Matched_Contacts')
+}
+
+
+def build_row(article, i):
+    """Build a single CSV row tuple (ordered as FIELDNAMES) from an article."""
+    # Bind the bound methods once; each is hit many times per article
+    g = article.get
+    metadata = g('_metadata', {})
+    m = metadata.get
 
     # Get matched entities
-    hotel_ids = article.get('Hotels', [])
-    company_ids = article.get('Companies', [])
-    contact_ids = article.get('Contacts', [])
+    hotel_ids = g('Hotels', [])
+    company_ids = g('Companies', [])
+    contact_ids = g('Contacts', [])
 
     # Get original entities
-    orig_hotels = metadata.get('original_hotels', [])
-    orig_companies = metadata.get('original_companies', [])
-    orig_contacts = metadata.get('original_contacts', [])
+    orig_hotels = m('original_hotels', [])
+    orig_companies = m('original_companies', [])
+    orig_contacts = m('original_contacts', [])
 
     # Count matches
     matched_hotels = sum(1 for h in hotel_ids if h is not None) if isinstance(hotel_ids, list) else 0
@@ -75,62 +86,120 @@ for i, article in enumerate(articles, 1):
         name = contact.get('name', 'N/A')
         title = contact.get('title', '')
         company = contact.get('company', '')
-        full_name = f"{name} - {title} at {company}".strip(' - at ')
+        # Build only the parts that exist; str.strip(' - at ') removed a
+        # character set from both ends, mangling names that start or end
+        # with any of ' -at'
+        parts = [name]
+        if title:
+            parts.append(f"- {title}")
+        if company:
+            parts.append(f"at {company}")
+        full_name = ' '.join(parts)
         contact_names.append(full_name)
 
         if idx < len(contact_ids) and contact_ids[idx]:
             contact_matches.append(f"{full_name} [ID:{contact_ids[idx]}]")
 
-    row = {
-        'Article_Number': metadata.get('article_number', i),
-        'Type': article.get('Type', 'Testing'),
-        'Source': article.get('Source', '')[:60],
-        'Headline': article.get('Headline', '')[:100],
-        'Article_Text': article.get('ArticleText', '')[:200] + '...' if len(article.get('ArticleText', '')) > 200 else article.get('ArticleText', ''),
-        'Publish_Date': article.get('PublishDate', ''),
+    # Fetch once; the truncation expression previously repeated the
+    # lookup three times per article
+    article_text = g('ArticleText', '')
+    if len(article_text) > 200:
+        article_text = article_text[:200] + '...'
+
+    # Tuple ordered as FIELDNAMES; csv.writer skips DictWriter's per-row
+    # fieldname-to-value walk
+    return (
+        m('article_number', i),
+        g('Type', 'Testing'),
+        g('Source', '')[:60],
+        g('Headline', '')[:100],
+        article_text,
+        g('PublishDate', ''),
 
         # Counts
-        'Total_Hotels': len(orig_hotels),
-        'Matched_Hotels': matched_hotels,
-        'Total_Companies': len(orig_companies),
-        'Matched_Companies': matched_companies,
-        'Total_Contacts': len(orig_contacts),
-        'Matched_Contacts': matched_contacts,
+        len(orig_hotels),
+        matched_hotels,
+        len(orig_companies),
+        matched_companies,
+        len(orig_contacts),
+        matched_contacts,
 
         # Entity lists
-        'Hotels_Extracted': '; '.join(hotel_names),
-        'Hotels_Matched': '; '.join(hotel_matches) if hotel_matches else 'None',
-        'Companies_Extracted': '; '.join(company_names),
-        'Companies_Matched': '; '.join(company_matches) if company_matches else 'None',
-        'Contacts_Extracted': '; '.join(contact_names),
-        'Contacts_Matched': '; '.join(contact_matches) if contact_matches else 'None',
+        '; '.join(hotel_names),
+        '; '.join(hotel_matches) if hotel_matches else 'None',
+        '; '.join(company_names),
+        '; '.join(company_matches) if company_matches else 'None',
+        '; '.join(contact_names),
+        '; '.join(contact_matches) if contact_matches else 'None',
+    )
+
+
+def iter_articles(json_file):
+    """Yield articles from the JSON file one at a time.
+
+    With ijson installed each article is parsed incrementally so peak
+    memory stays proportional to one article instead of the whole file.
+    """
+    with open(json_file, 'rb') as f:
+        if IJSON_SUPPORT:
+            yield from ijson.items(f, 'articles.item')
+        else:
+            yield from json.load(f)['articles']
+
+
+def main():
+    # Get the most recent articles JSON file; lexicographic max is the
+    # newest because filenames embed YYYYMMDD, and max over iglob avoids
+    # building and sorting the whole list
+    try:
+        json_file = max(glob.iglob('data/articles_*.json'))
+    except ValueError:
+        print("No articles JSON files found!")
+        sys.exit(1)
+
+    print(f"Reading: {json_file}")
+
+    # Generate output filename
+    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+    csv_file = f"data/articles_export_{timestamp}.csv"
+
+    # Stream articles straight into the CSV writer, accumulating summary
+    # counters in the same pass instead of keeping all rows in memory
+    total_articles = 0
+    totals = {
+        'Total_Hotels': 0, 'Matched_Hotels': 0,
+        'Total_Companies': 0, 'Matched_Companies': 0,
+        'Total_Contacts': 0, 'Matched_Contacts': 0
     }
 
-    csv_rows.append(row)
-
-# Write CSV
-print(f"Exporting {len(csv_rows)} articles to CSV...")
-with open(csv_file, 'w', newline='', encoding='utf-8') as f:
-    fieldnames = [
-        'Article_Number', 'Type', 'Source', 'Headline', 'Article_Text', 'Publish_Date',
-        'Total_Hotels', 'Matched_Hotels', 'Total_Companies', 'Matched_Companies',
-        'Total_Contacts', 'Matched_Contacts',
-        'Hotels_Extracted', 'Hotels_Matched',
-        'Companies_Extracted', 'Companies_Matched',
-        'Contacts_Extracted', 'Contacts_Matched'
-    ]
-
-    writer = csv.DictWriter(f, fieldnames=fieldnames)
-    writer.writeheader()
-    writer.writerows(csv_rows)
-
-print(f"Exported to: {csv_file}")
-print()
-print("Summary:")
-print(f"  Total articles: {len(csv_rows)}")
-print(f"  Total hotels extracted: {sum(row['Total_Hotels'] for row in csv_rows)}")
-print(f"  Total hotels matched: {sum(row['Matched_Hotels'] for row in csv_rows)}")
-print(f"  Total companies extracted: {sum(row['Total_Companies'] for row in csv_rows)}")
-print(f"  Total companies matched: {sum(row['Matched_Companies'] for row in csv_rows)}")
-print(f"  Total contacts extracted: {sum(row['Total_Contacts'] for row in csv_rows)}")
-print(f"  Total contacts matched: {sum(row['Matched_Contacts'] for row in csv_rows)}")
+    print("Exporting articles to CSV...")
+    with open(csv_file, 'w', newline='', encoding='utf-8') as f:
+        writer = csv.writer(f)
+        writer.writerow(FIELDNAMES)
+
+        # Hand rows to the C csv writer in chunks rather than one
+        # writerow() call per article; rows are still produced lazily from
+        # the streaming parse, so memory stays bounded by the chunk size
+        rows = (build_row(article, i) for i, article in enumerate(iter_articles(json_file), 1))
+        while chunk := list(islice(rows, WRITE_CHUNK_SIZE)):
+            writer.writerows(chunk)
+
+            total_articles += len(chunk)
+            for row in chunk:
+                for key, idx in COUNT_COLUMNS.items():
+                    totals[key] += row[idx]
+
+    print(f"Exported to: {csv_file}")
+    print()
+    print("Summary:")
+    print(f"  Total articles: {total_articles}")
+    print(f"  Total hotels extracted: {totals['Total_Hotels']}")
+    print(f"  Total hotels matched: {totals['Matched_Hotels']}")
+    print(f"  Total companies extracted: {totals['Total_Companies']}")
+    print(f"  Total companies matched: {totals['Matched_Companies']}")
+    print(f"  Total contacts extracted: {totals['Total_Contacts']}")
+    print(f"  Total contacts matched: {totals['Matched_Contacts']}")
+
+
+if __name__ == '__main__':
+    main()
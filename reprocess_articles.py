@@ -10,12 +10,11 @@ from entity_extractor import EntityExtractor
 from validation_orchestrator import ValidationOrchestrator
 from article_preparator import ArticlePreparator
 from report_generator import ReportGenerator
+from _json_cache import load_articles
 from datetime import datetime
 
 print("Loading existing articles...")
-with open('data/articles_20260128.json', 'r') as f:
-    data = json.load(f)
-    articles = data['articles']
+articles = load_articles('data/articles_20260128.json')['articles']
 
 print(f"Loaded {len(articles)} articles")
 print()
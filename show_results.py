@@ -1,20 +1,51 @@
 """Display validation results in a formatted table"""
-import json
+import os
 import sys
 import glob
 
-# Get the most recent articles JSON file
-json_files = sorted(glob.glob('data/articles_*.json'), reverse=True)
-if not json_files:
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'src'))
+
+from _json_cache import load_articles
+
+
+def split_matched(orig_entities, entry_ids):
+    """
+    Pair original entities with their entry IDs in one pass.
+
+    zip() walks both lists at C speed, so there is no per-element index
+    bounds check; entities beyond the end of entry_ids count as unmatched.
+
+    Returns:
+        Tuple of (matched, unmatched) where matched holds (entity, entry_id)
+        pairs and unmatched holds the entities without a valid ID.
+    """
+    ids = entry_ids if isinstance(entry_ids, list) else []
+    matched = []
+    unmatched = []
+
+    for entity, entry_id in zip(orig_entities, ids):
+        if entry_id is not None:
+            matched.append((entity, entry_id))
+        else:
+            unmatched.append(entity)
+
+    unmatched.extend(orig_entities[len(ids):])
+    return matched, unmatched
+
+# Get the most recent articles JSON file; lexicographic max is the
+# newest because filenames embed YYYYMMDD, and max over iglob avoids
+# building and sorting the whole list
+try:
+    json_file = max(glob.iglob('data/articles_*.json'))
+except ValueError:
     print("No articles JSON files found!")
     sys.exit(1)
 
-json_file = json_files[0]
 print(f"Reading: {json_file}\n")
 
-with open(json_file, 'r', encoding='utf-8') as f:
-    data = json.load(f)
-    articles = data['articles']
+# mtime-keyed pickle cache: repeat reads of the same snapshot skip the
+# JSON parse entirely
+articles = load_articles(json_file)['articles']
 
 # Count validated entities
 hotels_validated = 0
@@ -30,106 +61,97 @@ validated_contacts = []
 unmatched_hotels = []
 
 for article in articles:
+    metadata = article.get('_metadata', {})
+
     # Count hotels - check if Hotels array has EntryIDs
     hotel_ids = article.get('Hotels', [])
-    if isinstance(hotel_ids, list) and hotel_ids:
-        if '_metadata' in article and 'original_hotels' in article['_metadata']:
-            orig_hotels = article['_metadata']['original_hotels']
-            for i, hotel in enumerate(orig_hotels):
-                total_hotels += 1
-                if i < len(hotel_ids) and hotel_ids[i] is not None:
-                    hotels_validated += 1
-                    validated_hotels.append({
-                        'name': hotel.get('name', 'N/A'),
-                        'city': hotel.get('city', 'N/A'),
-                        'state': hotel.get('state', 'N/A'),
-                        'entry_id': hotel_ids[i]
-                    })
-                else:
-                    unmatched_hotels.append({
-                        'name': hotel.get('name', 'N/A'),
-                        'city': hotel.get('city', 'N/A'),
-                        'state': hotel.get('state', 'N/A')
-                    })
+    if isinstance(hotel_ids, list) and hotel_ids and 'original_hotels' in metadata:
+        matched, unmatched = split_matched(metadata['original_hotels'], hotel_ids)
+        total_hotels += len(matched) + len(unmatched)
+        hotels_validated += len(matched)
+        validated_hotels.extend({
+            'name': hotel.get('name', 'N/A'),
+            'city': hotel.get('city', 'N/A'),
+            'state': hotel.get('state', 'N/A'),
+            'entry_id': entry_id
+        } for hotel, entry_id in matched)
+        unmatched_hotels.extend({
+            'name': hotel.get('name', 'N/A'),
+            'city': hotel.get('city', 'N/A'),
+            'state': hotel.get('state', 'N/A')
+        } for hotel in unmatched)
 
     # Count companies - EntryIDs are in Companies array
-    company_ids = article.get('Companies', [])
-    if '_metadata' in article and 'original_companies' in article['_metadata']:
-        orig_companies = article['_metadata']['original_companies']
-        for i, company in enumerate(orig_companies):
-            total_companies += 1
-            if i < len(company_ids) and company_ids[i] is not None:
-                companies_validated += 1
-                validated_companies.append({
-                    'name': company.get('name', 'N/A'),
-                    'role': company.get('role', 'N/A'),
-                    'entry_id': company_ids[i]
-                })
+    if 'original_companies' in metadata:
+        matched, unmatched = split_matched(metadata['original_companies'], article.get('Companies', []))
+        total_companies += len(matched) + len(unmatched)
+        companies_validated += len(matched)
+        validated_companies.extend({
+            'name': company.get('name', 'N/A'),
+            'role': company.get('role', 'N/A'),
+            'entry_id': entry_id
+        } for company, entry_id in matched)
 
     # Count contacts - EntryIDs are in Contacts array
-    contact_ids = article.get('Contacts', [])
-    if '_metadata' in article and 'original_contacts' in article['_metadata']:
-        orig_contacts = article['_metadata']['original_contacts']
-        for i, contact in enumerate(orig_contacts):
-            total_contacts += 1
-            if i < len(contact_ids) and contact_ids[i] is not None:
-                contacts_validated += 1
-                validated_contacts.append({
-                    'name': contact.get('name', 'N/A'),
-                    'title': contact.get('title', 'N/A'),
-                    'company': contact.get('company', 'N/A'),
-                    'entry_id': contact_ids[i]
-                })
-
-print('=' * 80)
-print('VALIDATION SUMMARY')
-print('=' * 80)
-print(f'Hotels:    {hotels_validated}/{total_hotels} matched ({100*hotels_validated/total_hotels if total_hotels else 0:.1f}%)')
-print(f'Companies: {companies_validated}/{total_companies} matched ({100*companies_validated/total_companies if total_companies else 0:.1f}%)')
-print(f'Contacts:  {contacts_validated}/{total_contacts} matched ({100*contacts_validated/total_contacts if total_contacts else 0:.1f}%)')
-print()
+    if 'original_contacts' in metadata:
+        matched, unmatched = split_matched(metadata['original_contacts'], article.get('Contacts', []))
+        total_contacts += len(matched) + len(unmatched)
+        contacts_validated += len(matched)
+        validated_contacts.extend({
+            'name': contact.get('name', 'N/A'),
+            'title': contact.get('title', 'N/A'),
+            'company': contact.get('company', 'N/A'),
+            'entry_id': entry_id
+        } for contact, entry_id in matched)
+
+# Buffer the whole report and write it in one go: one write syscall for
+# the full output instead of one print per row
+divider = '=' * 80
+lines = [
+    divider,
+    'VALIDATION SUMMARY',
+    divider,
+    f'Hotels:    {hotels_validated}/{total_hotels} matched ({100*hotels_validated/total_hotels if total_hotels else 0:.1f}%)',
+    f'Companies: {companies_validated}/{total_companies} matched ({100*companies_validated/total_companies if total_companies else 0:.1f}%)',
+    f'Contacts:  {contacts_validated}/{total_contacts} matched ({100*contacts_validated/total_contacts if total_contacts else 0:.1f}%)',
+    '',
+]
 
 if validated_hotels:
-    print('=' * 80)
-    print(f'VALIDATED HOTELS ({len(validated_hotels)} total)')
-    print('=' * 80)
-    for i, hotel in enumerate(validated_hotels, 1):
-        name = hotel['name'][:40]
-        city = hotel['city'][:18]
-        print(f'{i:2}. {name:<40} | {city:<18} | ID: {hotel["entry_id"]}')
-    print()
-
-print('=' * 80)
-print(f'VALIDATED COMPANIES ({len(validated_companies)} total)')
-print('=' * 80)
-for i, company in enumerate(validated_companies[:20], 1):
-    name = company['name'][:40]
-    role = company['role'][:15]
-    print(f'{i:2}. {name:<40} | {role:<15} | ID: {company["entry_id"]}')
+    lines.extend((divider, f'VALIDATED HOTELS ({len(validated_hotels)} total)', divider))
+    lines.extend(
+        f'{i:2}. {hotel["name"][:40]:<40} | {hotel["city"][:18]:<18} | ID: {hotel["entry_id"]}'
+        for i, hotel in enumerate(validated_hotels, 1)
+    )
+    lines.append('')
+
+lines.extend((divider, f'VALIDATED COMPANIES ({len(validated_companies)} total)', divider))
+lines.extend(
+    f'{i:2}. {company["name"][:40]:<40} | {company["role"][:15]:<15} | ID: {company["entry_id"]}'
+    for i, company in enumerate(validated_companies[:20], 1)
+)
 if len(validated_companies) > 20:
-    print(f'... and {len(validated_companies) - 20} more')
-print()
+    lines.append(f'... and {len(validated_companies) - 20} more')
+lines.append('')
 
-print('=' * 80)
-print(f'VALIDATED CONTACTS ({len(validated_contacts)} total)')
-print('=' * 80)
+lines.extend((divider, f'VALIDATED CONTACTS ({len(validated_contacts)} total)', divider))
 if validated_contacts:
-    for i, contact in enumerate(validated_contacts, 1):
-        name = contact['name'][:30]
-        title = contact['title'][:25]
-        company = contact['company'][:20]
-        print(f'{i}. {name:<30} | {title:<25} | {company:<20} | ID: {contact["entry_id"]}')
+    lines.extend(
+        f'{i}. {contact["name"][:30]:<30} | {contact["title"][:25]:<25} | {contact["company"][:20]:<20} | ID: {contact["entry_id"]}'
+        for i, contact in enumerate(validated_contacts, 1)
+    )
 else:
-    print('No contacts validated')
-print()
+    lines.append('No contacts validated')
+lines.append('')
 
 if unmatched_hotels:
-    print('=' * 80)
-    print(f'UNMATCHED HOTELS ({len(unmatched_hotels)} total)')
-    print('=' * 80)
-    for i, hotel in enumerate(unmatched_hotels[:15], 1):
-        name = hotel['name'][:40]
-        city = hotel['city'][:18]
-        print(f'{i:2}. {name:<40} | {city:<18}')
+    lines.extend((divider, f'UNMATCHED HOTELS ({len(unmatched_hotels)} total)', divider))
+    lines.extend(
+        f'{i:2}. {hotel["name"][:40]:<40} | {hotel["city"][:18]:<18}'
+        for i, hotel in enumerate(unmatched_hotels[:15], 1)
+    )
     if len(unmatched_hotels) > 15:
-        print(f'... and {len(unmatched_hotels) - 15} more')
+        lines.append(f'... and {len(unmatched_hotels) - 15} more')
+
+lines.append('')
+sys.stdout.write('\n'.join(lines))
@@ -11,7 +11,7 @@ from .gmx_fetcher import GmxFetcher, fetch_newsletters
 from .newsletter_parser import NewsletterParser, parse_newsletter_email
 from .entity_extractor import EntityExtractor, extract_article_entities
 from .validation_orchestrator import ValidationOrchestrator
-from .article_preparator import ArticlePreparator, prepare_for_dealcloud, export_articles
+from .article_preparator import ArticlePreparator, PreparedArticle, prepare_for_dealcloud, export_articles
 from .report_generator import ReportGenerator, generate_report
 
 __version__ = "1.0.0"
@@ -26,6 +26,7 @@ __all__ = [
     "extract_article_entities",
     "ValidationOrchestrator",
     "ArticlePreparator",
+    "PreparedArticle",
     "prepare_for_dealcloud",
     "export_articles",
     "ReportGenerator",
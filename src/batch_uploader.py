@@ -5,24 +5,98 @@ Uploads articles to DealCloud in batches with rate limiting and retry logic.
 """
 
 import os
+import re
 import json
 import logging
 import time
-import tempfile
-import shutil
-from datetime import datetime
-from typing import List, Dict, Any
+import hashlib
+import itertools
+import threading
+import random
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from typing import List, Dict, Any, Iterable
+
+# Import orjson for fast JSON serialization (falls back to stdlib json)
+try:
+    import orjson
+    ORJSON_SUPPORT = True
+except ImportError:
+    ORJSON_SUPPORT = False
+
+# First HTTP status code embedded in an exception message, used when the
+# exception carries no response object to read the status from
+_HTTP_STATUS_RE = re.compile(r'\b([45]\d{2})\b')
+
+
+class TokenBucket:
+    """
+    Thread-safe token-bucket rate limiter.
+
+    Tokens refill continuously at `rate` per second up to `capacity`.
+    acquire() deducts a token, sleeping only when the bucket is empty, so
+    the steady-state request rate converges on `rate` without the idle
+    gaps a fixed per-request sleep leaves when the limit has headroom.
+    """
+
+    def __init__(self, rate: float, capacity: float = 1.0):
+        """
+        Initialize the token bucket.
+
+        Args:
+            rate: Sustained refill rate in tokens per second
+            capacity: Maximum tokens the bucket holds (burst size)
+        """
+        self.rate = rate
+        self.capacity = capacity
+        self.tokens = capacity
+        self.last = time.monotonic()
+        self.lock = threading.Lock()
+
+    def acquire(self, n: float = 1.0):
+        """Take n tokens, blocking until the bucket can cover them."""
+        with self.lock:
+            now = time.monotonic()
+            self.tokens = min(self.capacity, self.tokens + (now - self.last) * self.rate)
+            self.last = now
+
+            # Deduct first; a negative balance is debt owed to callers
+            # already committed to sleeping, so later arrivals queue
+            # behind it instead of stealing the refill
+            self.tokens -= n
+            if self.tokens >= 0:
+                return
+            deficit = -self.tokens / self.rate
+
+        # Sleep outside the lock so waiters don't block new arrivals
+        time.sleep(deficit)
 
 
 class BatchUploader:
     """Uploads articles in batches with rate limiting and retry."""
 
+    # Upper bound for adaptive batch growth (server-side request cap)
+    MAX_BATCH_SIZE = 500
+
+    # Checkpoint write debounce: save after this many batch completions
+    # or this many seconds, whichever comes first
+    CHECKPOINT_EVERY_BATCHES = 10
+    CHECKPOINT_EVERY_SECONDS = 30.0
+
     def __init__(
         self,
         dealcloud_uploader,
         batch_size: int = 50,
         rate_limit_delay: float = 1.0,
         max_retries: int = 3,
+        max_concurrency: int = 8,
+        latency_target: float = 15.0,
+        initial_delay: float = 1.0,
+        max_delay: float = 32.0,
+        jitter: float = 1.0,
+        adaptive_batch_size: bool = True,
         logger=None
     ):
         """
@@ -33,14 +107,61 @@ class BatchUploader:
             batch_size: Number of articles per batch (default: 50)
             rate_limit_delay: Delay in seconds between batches (default: 1.0)
             max_retries: Maximum retry attempts per batch (default: 3)
+            max_concurrency: Upper bound on batches uploaded in parallel (default: 8)
+            latency_target: Per-batch latency (seconds) above which concurrency
+                is backed off (default: 15.0)
+            initial_delay: Base for the exponential retry backoff (default: 1.0)
+            max_delay: Cap on any single backoff sleep in seconds (default: 32.0)
+            jitter: Maximum uniform jitter added to each backoff (default: 1.0)
+            adaptive_batch_size: Grow/shrink batch_size from observed batch
+                outcomes (default: True)
             logger: Optional logger instance
         """
         self.uploader = dealcloud_uploader
         self.batch_size = batch_size
         self.rate_limit_delay = rate_limit_delay
         self.max_retries = max_retries
+        self.max_concurrency = max_concurrency
+        self.latency_target = latency_target
+        self.initial_delay = initial_delay
+        self.max_delay = max_delay
+        self.jitter = jitter
+        self.adaptive_batch_size = adaptive_batch_size
         self.logger = logger or self._setup_logging()
 
+        # AIMD concurrency control, TCP-style: rate-limit errors halve the
+        # number of workers allowed to call the API at once, sustained
+        # success under the latency target adds one back. Workers pass
+        # through a semaphore gate; shrinking is done by recording permit
+        # debt that releases swallow, so the controller never blocks
+        self._aimd_lock = threading.Lock()
+        self._concurrency = float(max_concurrency)
+        self._permits = max_concurrency
+        self._permit_debt = 0
+        self._gate = threading.Semaphore(max_concurrency)
+        self._latencies = deque(maxlen=10)
+
+        # Guards checkpoint mutation and saves when batches complete
+        # out of order on the worker pool
+        self._checkpoint_lock = threading.Lock()
+
+        # Append-only journal of batch completions between snapshots;
+        # opened lazily per upload run (same pattern as ProgressTracker)
+        self._journal_path = None
+        self._journal_file = None
+
+        # Token bucket derived from the historical per-batch delay: the
+        # sustained rate matches one batch per rate_limit_delay seconds,
+        # with burst capacity so parallel workers aren't serialized when
+        # the limit has headroom. rate_limit_delay <= 0 disables limiting
+        if rate_limit_delay > 0:
+            self.limiter = TokenBucket(
+                rate=1.0 / rate_limit_delay,
+                capacity=max_concurrency
+            )
+        else:
+            self.limiter = None
+
     def _setup_logging(self):
         """Set up logging for the batch uploader."""
         today = datetime.now().strftime("%Y%m%d")
@@ -71,6 +192,8 @@ class BatchUploader:
         return {
             "total_articles": total_articles,
             "uploaded_articles": 0,
+            "uploaded_through_index": 0,
+            "uploaded_keys": [],
             "current_batch": 0,
             "last_successful_batch": -1,
             "failed_batches": [],
@@ -95,13 +218,131 @@ class BatchUploader:
         """
         if os.path.exists(checkpoint_path):
             try:
-                with open(checkpoint_path, 'r', encoding='utf-8') as f:
-                    return json.load(f)
+                with open(checkpoint_path, 'rb') as f:
+                    raw = f.read()
+                checkpoint = orjson.loads(raw) if ORJSON_SUPPORT else json.loads(raw.decode('utf-8'))
             except Exception as e:
                 self.logger.error(f"Failed to load upload checkpoint: {e}")
                 return None
+
+            # Fold in batch events journaled since the snapshot was taken
+            self._replay_upload_journal(checkpoint, checkpoint_path + '.journal')
+            return checkpoint
         return None
 
+    def _replay_upload_journal(self, checkpoint: Dict[str, Any], journal_path: str) -> int:
+        """
+        Fold journal events written since the last snapshot into a loaded
+        checkpoint.
+
+        Each journal line is one batch completion; replaying them
+        restores progress the debounced snapshot hadn't captured yet.
+
+        Args:
+            checkpoint: Loaded checkpoint dict (mutated in place)
+            journal_path: Path to the journal file
+
+        Returns:
+            Number of events replayed
+        """
+        if not os.path.exists(journal_path):
+            return 0
+
+        replayed = 0
+        succeeded = set()
+        ranges = set()
+
+        try:
+            with open(journal_path, 'rb') as f:
+                for line in f:
+                    line = line.strip()
+                    if not line:
+                        continue
+                    try:
+                        event = orjson.loads(line) if ORJSON_SUPPORT else json.loads(line.decode('utf-8'))
+                    except Exception:
+                        # Torn tail write from an interrupted run
+                        continue
+
+                    uploaded = event.get('uploaded', 0)
+                    stats = checkpoint['statistics']
+                    checkpoint['uploaded_articles'] += uploaded
+                    stats['successful_uploads'] += uploaded
+                    stats['failed_uploads'] += event.get('failed', 0)
+
+                    if uploaded > 0:
+                        stats['batches_completed'] += 1
+                        succeeded.add(event.get('batch_num'))
+                        if 'start_idx' in event and 'end_idx' in event:
+                            ranges.add((event['start_idx'], event['end_idx']))
+                    else:
+                        stats['batches_failed'] += 1
+                    replayed += 1
+
+            # Advance both contiguous frontiers past the replayed events
+            frontier = checkpoint.get('last_successful_batch', -1)
+            while frontier + 1 in succeeded:
+                frontier += 1
+            checkpoint['last_successful_batch'] = frontier
+
+            idx_frontier = checkpoint.get('uploaded_through_index', 0)
+            advanced = True
+            while advanced:
+                advanced = False
+                for span in list(ranges):
+                    if span[0] <= idx_frontier:
+                        idx_frontier = max(idx_frontier, span[1])
+                        ranges.discard(span)
+                        advanced = True
+            checkpoint['uploaded_through_index'] = idx_frontier
+
+            if replayed:
+                self.logger.info(f"Replayed {replayed} batch events from upload journal")
+        except Exception as e:
+            self.logger.error(f"Failed to replay upload journal: {e}")
+
+        return replayed
+
+    def _append_upload_journal(self, event: Dict[str, Any]):
+        """
+        Append one batch-completion event to the journal.
+
+        A one-line append is O(1) regardless of checkpoint size, unlike
+        the full snapshot rewrite, so progress can be durably recorded
+        per batch without fsync-ing the whole state.
+
+        Args:
+            event: Batch completion record (batch_num, uploaded, etc.)
+        """
+        try:
+            if self._journal_file is None:
+                # Parent directory already created in upload_in_batches
+                self._journal_file = open(self._journal_path, 'ab')
+
+            if ORJSON_SUPPORT:
+                self._journal_file.write(orjson.dumps(event) + b'\n')
+            else:
+                self._journal_file.write((json.dumps(event, ensure_ascii=False) + '\n').encode('utf-8'))
+            self._journal_file.flush()
+            os.fsync(self._journal_file.fileno())
+        except Exception as e:
+            self.logger.error(f"Failed to append to upload journal: {e}")
+
+    def _truncate_upload_journal(self):
+        """Discard the journal after a snapshot has captured its contents."""
+        if self._journal_file is not None:
+            try:
+                self._journal_file.close()
+            except Exception:
+                pass
+            self._journal_file = None
+
+        if self._journal_path and os.path.exists(self._journal_path):
+            try:
+                os.remove(self._journal_path)
+            except OSError as e:
+                self.logger.warning(f"Failed to remove upload journal: {e}")
+
     def _save_upload_checkpoint(self, checkpoint_data: Dict[str, Any], checkpoint_path: str):
         """
         Save upload checkpoint atomically.
@@ -112,34 +353,226 @@ class BatchUploader:
         """
         checkpoint_data['last_updated'] = datetime.now().isoformat()
 
+        # Deterministic temp path: there is only ever one writer per
+        # checkpoint path, so a fixed sibling name skips the per-save
+        # random-filename generation NamedTemporaryFile does. The parent
+        # directory is created once up front in upload_in_batches
+        tmp_path = f"{checkpoint_path}.tmp"
+
         try:
-            # Create parent directory if needed
-            os.makedirs(os.path.dirname(checkpoint_path) or '.', exist_ok=True)
-
-            # Write to temp file first
-            with tempfile.NamedTemporaryFile(
-                mode='w',
-                encoding='utf-8',
-                delete=False,
-                dir=os.path.dirname(checkpoint_path) or '.',
-                suffix='.tmp'
-            ) as tmp_file:
-                json.dump(checkpoint_data, tmp_file, indent=2, ensure_ascii=False)
-                tmp_path = tmp_file.name
-
-            # Atomic rename
-            shutil.move(tmp_path, checkpoint_path)
+            # Write to temp file first; orjson emits bytes directly,
+            # skipping the intermediate Python str the stdlib builds
+            with open(tmp_path, 'wb') as tmp_file:
+                if ORJSON_SUPPORT:
+                    tmp_file.write(orjson.dumps(
+                        checkpoint_data,
+                        option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS
+                    ))
+                else:
+                    tmp_file.write(json.dumps(checkpoint_data, indent=2, ensure_ascii=False).encode('utf-8'))
+
+            # Atomic rename: the temp file is created in the target
+            # directory, so this is a single same-filesystem rename(2)
+            os.replace(tmp_path, checkpoint_path)
 
             self.logger.debug(f"Saved upload checkpoint: batch {checkpoint_data['current_batch']}")
 
         except Exception as e:
             self.logger.error(f"Failed to save upload checkpoint: {e}")
-            if 'tmp_path' in locals() and os.path.exists(tmp_path):
+            if os.path.exists(tmp_path):
                 try:
                     os.remove(tmp_path)
                 except:
                     pass
 
+    @staticmethod
+    def _retry_after_seconds(headers):
+        """
+        Parse a Retry-After header into seconds.
+
+        Args:
+            headers: Response headers mapping (or None)
+
+        Returns:
+            Cooldown in seconds, or None if the header is absent/unparsable
+        """
+        if not headers:
+            return None
+
+        value = headers.get('Retry-After') or headers.get('retry-after')
+        if value is None:
+            return None
+
+        # Numeric form: delay in seconds
+        try:
+            return max(0.0, float(value))
+        except (TypeError, ValueError):
+            pass
+
+        # HTTP-date form: absolute time the cooldown ends
+        try:
+            retry_at = parsedate_to_datetime(str(value))
+            return max(0.0, (retry_at - datetime.now(timezone.utc)).total_seconds())
+        except (TypeError, ValueError):
+            return None
+
+    @staticmethod
+    def _article_key(article) -> str:
+        """
+        Stable idempotency key for an article.
+
+        Hashes the fields that identify an article (headline, publish
+        date, body) so the same article yields the same key across runs
+        regardless of metadata or dict ordering. Retries and resumed
+        uploads use the key set in the checkpoint to skip articles that
+        already made it to the server.
+
+        Args:
+            article: Prepared article dict (or object with to_dict())
+
+        Returns:
+            32-char hex digest, or None if the article isn't hashable
+        """
+        raw = article.to_dict() if hasattr(article, 'to_dict') else article
+        try:
+            identity = {k: raw.get(k) for k in ('Headline', 'PublishDate', 'ArticleText')}
+        except AttributeError:
+            return None
+
+        if ORJSON_SUPPORT:
+            try:
+                payload = orjson.dumps(identity, option=orjson.OPT_SORT_KEYS)
+            except TypeError:
+                return None
+        else:
+            try:
+                payload = json.dumps(identity, sort_keys=True, default=str).encode('utf-8')
+            except TypeError:
+                return None
+
+        return hashlib.blake2b(payload, digest_size=16).hexdigest()
+
+    @staticmethod
+    def _classify_error(e) -> tuple:
+        """
+        Classify an upload exception as retryable or permanent.
+
+        Rate limits (429), server errors (5xx), and network/timeout
+        failures can succeed on retry; other 4xx responses (auth,
+        validation, bad request) never will, so retrying them only burns
+        max_retries worth of backoff sleeps.
+
+        Args:
+            e: Exception raised by the upload call
+
+        Returns:
+            Tuple of (error_kind, retryable) where error_kind is the
+            exception class name
+        """
+        error_kind = e.__class__.__name__
+
+        # Prefer an explicit status code from the response, falling back
+        # to the first 3-digit code in the message
+        status = getattr(getattr(e, 'response', None), 'status_code', None)
+        if status is None:
+            match = _HTTP_STATUS_RE.search(str(e))
+            if match:
+                status = int(match.group(1))
+
+        if status is not None:
+            retryable = status == 429 or status >= 500
+        else:
+            # No status at all usually means a network-level failure
+            # (timeout, connection reset); retrying is the right call,
+            # and dropping a batch is worse than a wasted retry
+            retryable = True
+
+        return error_kind, retryable
+
+    def _release_slot(self):
+        """Return a concurrency-gate permit, honoring pending shrink debt."""
+        with self._aimd_lock:
+            if self._permit_debt > 0:
+                self._permit_debt -= 1
+                return
+        self._gate.release()
+
+    def _set_effective_concurrency(self, target: float):
+        """
+        Resize the concurrency gate to the given (clamped) target.
+
+        Growing releases permits immediately; shrinking reclaims idle
+        permits without blocking and books the rest as debt that worker
+        releases absorb.
+        """
+        target = int(round(max(1.0, min(float(self.max_concurrency), target))))
+        diff = target - self._permits
+
+        if diff > 0:
+            for _ in range(diff):
+                if self._permit_debt > 0:
+                    self._permit_debt -= 1
+                else:
+                    self._gate.release()
+        else:
+            for _ in range(-diff):
+                if not self._gate.acquire(blocking=False):
+                    self._permit_debt += 1
+
+        if target != self._permits:
+            self.logger.info(f"Adjusted upload concurrency: {self._permits} -> {target}")
+        self._permits = target
+
+    def _adjust_concurrency(self, stats: Dict[str, Any], latency: float):
+        """
+        AIMD update after a batch call: halve on rate-limit errors or
+        sustained latency above target, otherwise add one worker back.
+
+        Args:
+            stats: Upload statistics dict from the completed call
+            latency: Duration of the upload call in seconds
+        """
+        with self._aimd_lock:
+            self._latencies.append(latency)
+            avg_latency = sum(self._latencies) / len(self._latencies)
+
+            rate_limited = '429' in str(stats.get('error', ''))
+            if rate_limited or avg_latency > self.latency_target:
+                self._concurrency = max(1.0, self._concurrency * 0.5)
+            else:
+                self._concurrency = min(float(self.max_concurrency), self._concurrency + 0.5)
+
+            self._set_effective_concurrency(self._concurrency)
+
+    def _adjust_batch_size(self, stats: Dict[str, Any], latency: float):
+        """
+        Resize batch_size from the last batch's outcome.
+
+        Clean batches under the latency target grow the next batch ~25%
+        (capped at MAX_BATCH_SIZE); errors or failures halve it. Larger
+        batches amortize per-request TLS/serialization overhead, so this
+        walks toward the biggest batch the server sustains.
+
+        Args:
+            stats: Upload statistics dict from the completed call
+            latency: Duration of the upload call in seconds
+        """
+        if not self.adaptive_batch_size:
+            return
+
+        with self._aimd_lock:
+            if stats.get('error') or stats.get('failed', 0) > 0:
+                new_size = max(1, self.batch_size // 2)
+            elif latency < self.latency_target:
+                new_size = min(self.MAX_BATCH_SIZE,
+                               max(self.batch_size + 1, int(self.batch_size * 1.25)))
+            else:
+                return
+
+            if new_size != self.batch_size:
+                self.logger.debug(f"Adjusted batch size: {self.batch_size} -> {new_size}")
+                self.batch_size = new_size
+
     def _upload_batch(self, batch: List[Dict[str, Any]], batch_num: int) -> Dict[str, Any]:
         """
         Upload a single batch of articles.
@@ -151,21 +584,43 @@ class BatchUploader:
         Returns:
             Upload statistics dict
         """
-        self.logger.info(f"Uploading batch {batch_num} ({len(batch)} articles)...")
-
+        self._gate.acquire()
         try:
-            stats = self.uploader.upload_articles(batch)
+            if self.limiter:
+                self.limiter.acquire()
+
+            self.logger.info(f"Uploading batch {batch_num} ({len(batch)} articles)...")
+
+            started = time.monotonic()
+            try:
+                stats = self.uploader.upload_articles(batch)
+            except Exception as e:
+                self.logger.error(f"Error uploading batch {batch_num}: {e}")
+                error_kind, retryable = self._classify_error(e)
+                stats = {
+                    'total_articles': len(batch),
+                    'uploaded': 0,
+                    'failed': len(batch),
+                    'entry_ids': [],
+                    'success_rate': 0,
+                    'error': str(e),
+                    'error_kind': error_kind,
+                    'retryable': retryable
+                }
+
+                # Surface the server's requested cooldown (if any) so the
+                # retry loop can sleep exactly that long
+                headers = getattr(getattr(e, 'response', None), 'headers', None)
+                retry_after = self._retry_after_seconds(headers)
+                if retry_after is not None:
+                    stats['retry_after'] = retry_after
+
+            latency = time.monotonic() - started
+            self._adjust_concurrency(stats, latency)
+            self._adjust_batch_size(stats, latency)
             return stats
-        except Exception as e:
-            self.logger.error(f"Error uploading batch {batch_num}: {e}")
-            return {
-                'total_articles': len(batch),
-                'uploaded': 0,
-                'failed': len(batch),
-                'entry_ids': [],
-                'success_rate': 0,
-                'error': str(e)
-            }
+        finally:
+            self._release_slot()
 
     def _retry_with_backoff(self, batch: List[Dict[str, Any]], batch_num: int) -> Dict[str, Any]:
         """
@@ -178,11 +633,23 @@ class BatchUploader:
         Returns:
             Upload statistics dict
         """
+        stats = None
         for attempt in range(self.max_retries):
-            # Calculate backoff delay: 0s, 2s, 4s
             if attempt > 0:
-                backoff_delay = attempt * 2
-                self.logger.info(f"Retrying batch {batch_num} (attempt {attempt + 1}/{self.max_retries}) after {backoff_delay}s...")
+                # Prefer the server's own cooldown over a guessed delay;
+                # a 10% jitter keeps retrying workers from waking together
+                retry_after = stats.get('retry_after') if stats else None
+                if retry_after is not None:
+                    backoff_delay = retry_after + random.uniform(0, retry_after * 0.1)
+                    self.logger.info(f"Server requested cooldown of {retry_after:.1f}s for batch {batch_num}")
+                else:
+                    # Jittered exponential backoff (2s, 4s, 8s... capped);
+                    # the jitter decorrelates workers that failed together
+                    backoff_delay = min(
+                        self.max_delay,
+                        self.initial_delay * (2 ** attempt) + random.uniform(0, self.jitter)
+                    )
+                self.logger.info(f"Retrying batch {batch_num} (attempt {attempt + 1}/{self.max_retries}) after {backoff_delay:.1f}s...")
                 time.sleep(backoff_delay)
 
             stats = self._upload_batch(batch, batch_num)
@@ -193,6 +660,16 @@ class BatchUploader:
                     self.logger.info(f"Batch {batch_num} succeeded on attempt {attempt + 1}")
                 return stats
 
+            # Permanent failures (auth, validation, 400s) won't succeed
+            # no matter how long we back off; fail fast instead of
+            # burning max_retries worth of sleeps
+            if not stats.get('retryable', True):
+                self.logger.error(
+                    f"Batch {batch_num} failed with permanent error "
+                    f"({stats.get('error_kind', 'unknown')}), not retrying"
+                )
+                return stats
+
             # If completely failed and we have retries left, continue
             if attempt < self.max_retries - 1:
                 self.logger.warning(f"Batch {batch_num} failed, will retry...")
@@ -204,26 +681,42 @@ class BatchUploader:
 
     def upload_in_batches(
         self,
-        articles: List[Dict[str, Any]],
+        articles: Iterable[Dict[str, Any]],
         checkpoint_path: str,
         resume: bool = False
     ) -> Dict[str, Any]:
         """
         Upload articles in batches with checkpointing.
 
+        Articles may be any iterable (list or streaming iterator); batches
+        are drawn with itertools.islice so the full set never has to be
+        resident in memory. Up to max_concurrency batches are in flight at
+        once on a thread pool: the upload is dominated by HTTP round-trip
+        wait, so overlapping requests cuts wall time roughly by the
+        concurrency factor.
+
         Args:
-            articles: List of prepared articles
+            articles: Iterable of prepared articles
             checkpoint_path: Path to checkpoint file
             resume: If True, resume from checkpoint
 
         Returns:
             Upload statistics dict
         """
-        total_articles = len(articles)
-        self.logger.info(f"Starting batch upload of {total_articles} articles")
-        self.logger.info(f"Batch size: {self.batch_size}, Rate limit: {self.rate_limit_delay}s, Max retries: {self.max_retries}")
-
-        # Initialize or load checkpoint
+        article_iter = iter(articles)
+        self.logger.info("Starting batch upload")
+        self.logger.info(
+            f"Batch size: {self.batch_size}, Rate limit: {self.rate_limit_delay}s, "
+            f"Max retries: {self.max_retries}, Max concurrency: {self.max_concurrency}"
+        )
+
+        # Create the checkpoint directory once up front so the per-save
+        # and per-journal-append paths don't repeat the makedirs syscall
+        os.makedirs(os.path.dirname(checkpoint_path) or '.', exist_ok=True)
+
+        # Initialize or load checkpoint; the journal sits beside the
+        # snapshot and records per-batch deltas between debounced saves
+        self._journal_path = checkpoint_path + '.journal'
         checkpoint = None
         start_batch = 0
 
@@ -236,52 +729,201 @@ class BatchUploader:
                 self.logger.warning("Resume requested but no checkpoint found, starting fresh")
 
         if not checkpoint:
-            checkpoint = self._initialize_upload_checkpoint(total_articles)
-
-        # Split articles into batches
-        total_batches = (total_articles + self.batch_size - 1) // self.batch_size
-        self.logger.info(f"Total batches: {total_batches}")
-
-        # Process batches
-        for batch_num in range(start_batch, total_batches):
-            # Extract batch
-            start_idx = batch_num * self.batch_size
-            end_idx = min(start_idx + self.batch_size, total_articles)
-            batch = articles[start_idx:end_idx]
-
-            checkpoint['current_batch'] = batch_num
-
-            # Upload with retry
-            stats = self._retry_with_backoff(batch, batch_num)
-
-            # Update checkpoint
-            uploaded = stats.get('uploaded', 0)
-            failed = stats.get('failed', 0)
-
-            checkpoint['uploaded_articles'] += uploaded
-            checkpoint['statistics']['successful_uploads'] += uploaded
-            checkpoint['statistics']['failed_uploads'] += failed
-
-            if uploaded > 0:
-                checkpoint['last_successful_batch'] = batch_num
-                checkpoint['statistics']['batches_completed'] += 1
-                self.logger.info(f"Batch {batch_num} completed: {uploaded}/{len(batch)} uploaded")
-            else:
-                checkpoint['statistics']['batches_failed'] += 1
-                checkpoint['failed_batches'].append({
-                    "batch_num": batch_num,
-                    "error": stats.get('error', 'Unknown error'),
-                    "timestamp": datetime.now().isoformat()
-                })
-                self.logger.error(f"Batch {batch_num} failed completely")
-
-            # Save checkpoint every batch (for fine-grained resume)
-            self._save_upload_checkpoint(checkpoint, checkpoint_path)
-
-            # Rate limiting between batches (except for last batch)
-            if batch_num < total_batches - 1:
-                self.logger.debug(f"Rate limit delay: {self.rate_limit_delay}s")
-                time.sleep(self.rate_limit_delay)
+            checkpoint = self._initialize_upload_checkpoint(0)
+
+        # Batches are dispatched onto a thread pool and complete out of
+        # order, so progress is tracked as contiguous frontiers: batch
+        # numbers for last_successful_batch, and article index ranges
+        # (start_idx, end_idx) for uploaded_through_index. The index
+        # frontier is what resume uses, since adaptive sizing means batch
+        # numbers no longer map to fixed article offsets
+        total_articles = 0
+        batch_num = 0
+        in_flight = {}
+        succeeded_batches = set()
+        succeeded_ranges = set()
+
+        # Resume by article index when the checkpoint carries one;
+        # otherwise fall back to skipping whole batch numbers (legacy
+        # checkpoints written before adaptive sizing)
+        resume_index = checkpoint.get('uploaded_through_index', 0) if resume else 0
+        if resume_index:
+            skipped = sum(1 for _ in itertools.islice(article_iter, resume_index))
+            total_articles = skipped
+            batch_num = start_batch
+            self.logger.info(f"Resuming past {skipped} already-uploaded articles")
+
+        # Resumed runs treat already-uploaded batches as part of the
+        # contiguous success frontier
+        succeeded_batches.update(range(start_batch))
+
+        # Idempotency keys of everything known to have reached the
+        # server; the set makes resumed or duplicated articles cheap to
+        # skip, the checkpoint list persists them across runs
+        checkpoint.setdefault('uploaded_keys', [])
+        uploaded_keys = set(checkpoint['uploaded_keys'])
+
+        self._batches_since_save = 0
+        self._last_checkpoint_save = time.monotonic()
+
+        def advance_frontiers():
+            # Caller holds _checkpoint_lock. Fold newly-succeeded batch
+            # numbers and article spans into the contiguous frontiers
+            frontier = checkpoint['last_successful_batch']
+            while frontier + 1 in succeeded_batches:
+                frontier += 1
+            checkpoint['last_successful_batch'] = frontier
+
+            idx_frontier = checkpoint.get('uploaded_through_index', 0)
+            advanced = True
+            while advanced:
+                advanced = False
+                for span in list(succeeded_ranges):
+                    if span[0] <= idx_frontier:
+                        idx_frontier = max(idx_frontier, span[1])
+                        succeeded_ranges.discard(span)
+                        advanced = True
+            checkpoint['uploaded_through_index'] = idx_frontier
+
+        def process_completed(done_futures):
+            for future in done_futures:
+                done_num, done_size, done_start, done_end, done_keys = in_flight.pop(future)
+                stats = future.result()
+
+                uploaded = stats.get('uploaded', 0)
+                failed = stats.get('failed', 0)
+
+                with self._checkpoint_lock:
+                    checkpoint['total_articles'] = total_articles
+                    checkpoint['uploaded_articles'] += uploaded
+                    checkpoint['statistics']['successful_uploads'] += uploaded
+                    checkpoint['statistics']['failed_uploads'] += failed
+
+                    if uploaded > 0:
+                        succeeded_batches.add(done_num)
+                        succeeded_ranges.add((done_start, done_end))
+                        advance_frontiers()
+
+                        # Only a clean batch proves every article landed;
+                        # partial successes can't be attributed per
+                        # article, so their keys stay unrecorded
+                        if failed == 0:
+                            for key in done_keys:
+                                if key and key not in uploaded_keys:
+                                    uploaded_keys.add(key)
+                                    checkpoint['uploaded_keys'].append(key)
+
+                        checkpoint['statistics']['batches_completed'] += 1
+                        self.logger.info(f"Batch {done_num} completed: {uploaded}/{done_size} uploaded")
+                    else:
+                        checkpoint['statistics']['batches_failed'] += 1
+                        checkpoint['failed_batches'].append({
+                            "batch_num": done_num,
+                            "start_idx": done_start,
+                            "end_idx": done_end,
+                            "error": stats.get('error', 'Unknown error'),
+                            "timestamp": datetime.now().isoformat()
+                        })
+                        self.logger.error(f"Batch {done_num} failed completely")
+
+                    # O(1) durability per batch: append the delta to the
+                    # journal; the full snapshot is only rewritten on the
+                    # debounce cadence and then absorbs the journal
+                    self._append_upload_journal({
+                        "batch_num": done_num,
+                        "uploaded": uploaded,
+                        "failed": failed,
+                        "start_idx": done_start,
+                        "end_idx": done_end,
+                        "ts": datetime.now().isoformat()
+                    })
+
+                    # Debounced save: serializing and renaming the full
+                    # checkpoint on every completion is fsync churn, so
+                    # write every N batches or T seconds, whichever first
+                    # (a final save always runs when the loop exits)
+                    self._batches_since_save += 1
+                    now = time.monotonic()
+                    if (self._batches_since_save >= self.CHECKPOINT_EVERY_BATCHES
+                            or now - self._last_checkpoint_save > self.CHECKPOINT_EVERY_SECONDS):
+                        self._save_upload_checkpoint(checkpoint, checkpoint_path)
+                        self._truncate_upload_journal()
+                        self._batches_since_save = 0
+                        self._last_checkpoint_save = now
+
+        with ThreadPoolExecutor(max_workers=self.max_concurrency) as executor:
+            try:
+                while True:
+                    # self.batch_size is re-read every slice so adaptive
+                    # resizing takes effect on the next dispatch
+                    batch = list(itertools.islice(article_iter, self.batch_size))
+                    if not batch:
+                        break
+
+                    start_idx = total_articles
+                    total_articles += len(batch)
+
+                    # Legacy checkpoints: skip batches already uploaded
+                    if batch_num < start_batch and not resume_index:
+                        succeeded_ranges.add((start_idx, total_articles))
+                        batch_num += 1
+                        continue
+
+                    # Keep the in-flight window bounded by the pool size so a
+                    # streaming source is not drained into memory
+                    while len(in_flight) >= self.max_concurrency:
+                        done, _ = wait(in_flight, return_when=FIRST_COMPLETED)
+                        process_completed(done)
+
+                    # Drop articles whose idempotency key is already
+                    # recorded, so retried and resumed runs can't create
+                    # duplicate entries for them. Runs after the window
+                    # wait so keys from just-completed batches count
+                    batch_keys = [self._article_key(a) for a in batch]
+                    if uploaded_keys:
+                        kept = [(a, k) for a, k in zip(batch, batch_keys)
+                                if k is None or k not in uploaded_keys]
+                        if len(kept) < len(batch):
+                            self.logger.info(
+                                f"Skipping {len(batch) - len(kept)} already-uploaded "
+                                f"articles in batch {batch_num}"
+                            )
+                            batch = [a for a, _ in kept]
+                            batch_keys = [k for _, k in kept]
+
+                    # Everything in this batch was already uploaded; its
+                    # span still counts toward the success frontier
+                    if not batch:
+                        with self._checkpoint_lock:
+                            succeeded_batches.add(batch_num)
+                            succeeded_ranges.add((start_idx, total_articles))
+                            advance_frontiers()
+                        batch_num += 1
+                        continue
+
+                    with self._checkpoint_lock:
+                        checkpoint['current_batch'] = batch_num
+
+                    # Rate limiting happens in the workers via the token
+                    # bucket, so dispatch itself never sleeps
+                    future = executor.submit(self._retry_with_backoff, batch, batch_num)
+                    in_flight[future] = (batch_num, len(batch), start_idx, total_articles, batch_keys)
+
+                    batch_num += 1
+
+                # Drain the remaining in-flight batches
+                while in_flight:
+                    done, _ = wait(in_flight, return_when=FIRST_COMPLETED)
+                    process_completed(done)
+            finally:
+                # Final write so the on-disk checkpoint always reflects
+                # everything processed, debounce notwithstanding; the
+                # journal is then redundant and dropped
+                with self._checkpoint_lock:
+                    self._save_upload_checkpoint(checkpoint, checkpoint_path)
+                    self._truncate_upload_journal()
+
+        total_batches = batch_num
 
         # Final statistics
         final_stats = {
@@ -304,12 +946,13 @@ class BatchUploader:
 
 # Convenience function
 def upload_with_batching(
-    articles: List[Dict[str, Any]],
+    articles: Iterable[Dict[str, Any]],
     dealcloud_uploader,
     checkpoint_path: str = "data/upload_checkpoint.json",
     batch_size: int = 50,
     rate_limit_delay: float = 1.0,
     max_retries: int = 3,
+    max_concurrency: int = 8,
     resume: bool = False,
     logger=None
 ) -> Dict[str, Any]:
@@ -317,12 +960,13 @@ def upload_with_batching(
     Convenience function to upload articles in batches.
 
     Args:
-        articles: List of prepared articles
+        articles: Iterable of prepared articles
         dealcloud_uploader: DealCloudUploader instance
         checkpoint_path: Path to checkpoint file
         batch_size: Articles per batch
         rate_limit_delay: Delay between batches (seconds)
         max_retries: Max retry attempts per batch
+        max_concurrency: Batches uploaded in parallel
         resume: Resume from checkpoint
         logger: Optional logger instance
 
@@ -334,6 +978,7 @@ def upload_with_batching(
         batch_size=batch_size,
         rate_limit_delay=rate_limit_delay,
         max_retries=max_retries,
+        max_concurrency=max_concurrency,
         logger=logger
     )
 
@@ -6,9 +6,16 @@ Provides reusable utilities for connecting to DealCloud and exploring schema.
 
 import os
 import logging
+import weakref
 from typing import Optional, Dict, List, Any
 from dotenv import load_dotenv
 
+# Per-client index of lowercased object names, built once per client so
+# repeated lookups are O(1) dict hits instead of re-lowercasing three
+# attributes per object on every call. WeakKeyDictionary lets the index
+# die with its client
+_OBJECT_INDEX_CACHE = weakref.WeakKeyDictionary()
+
 
 def get_client():
     """
@@ -62,6 +69,44 @@ def get_client():
         raise RuntimeError(f"Failed to connect to DealCloud: {str(e)}")
 
 
+def _object_name_index(dc) -> Dict[str, Any]:
+    """
+    Build (or fetch) the lowercase name -> object index for a client.
+
+    Args:
+        dc: DealCloud client instance
+
+    Returns:
+        Dict mapping each object's lowercased apiName/singularName/
+        pluralName to the object model (first claimant wins, matching
+        the original scan order)
+    """
+    try:
+        index = _OBJECT_INDEX_CACHE.get(dc)
+    except TypeError:
+        index = None
+    if index is not None:
+        return index
+
+    index = {}
+    for obj in dc.get_objects():
+        # Handle Pydantic model attributes
+        obj_api_name = getattr(obj, 'apiName', '') or getattr(obj, 'name', '')
+        obj_singular = getattr(obj, 'singularName', '')
+        obj_plural = getattr(obj, 'pluralName', '')
+
+        for candidate in (obj_api_name, obj_singular, obj_plural):
+            if candidate:
+                index.setdefault(candidate.lower(), obj)
+
+    try:
+        _OBJECT_INDEX_CACHE[dc] = index
+    except TypeError:
+        # Client isn't weak-referenceable; skip caching
+        pass
+    return index
+
+
 def find_object_by_name(dc, name: str, case_sensitive: bool = False) -> Optional[Any]:
     """
     Find a DealCloud object by its API name or display name.
@@ -75,21 +120,16 @@ def find_object_by_name(dc, name: str, case_sensitive: bool = False) -> Optional
         Object model if found, None otherwise
     """
     try:
-        objects = dc.get_objects()
-
-        search_name = name if case_sensitive else name.lower()
+        if not case_sensitive:
+            return _object_name_index(dc).get(name.lower())
 
-        for obj in objects:
-            # Handle Pydantic model attributes
+        # Case-sensitive lookups are the rare path; scan directly
+        for obj in dc.get_objects():
             obj_api_name = getattr(obj, 'apiName', '') or getattr(obj, 'name', '')
             obj_singular = getattr(obj, 'singularName', '')
             obj_plural = getattr(obj, 'pluralName', '')
 
-            compare_api = obj_api_name if case_sensitive else obj_api_name.lower()
-            compare_singular = obj_singular if case_sensitive else obj_singular.lower()
-            compare_plural = obj_plural if case_sensitive else obj_plural.lower()
-
-            if search_name in [compare_api, compare_singular, compare_plural]:
+            if name in (obj_api_name, obj_singular, obj_plural):
                 return obj
 
         return None
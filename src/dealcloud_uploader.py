@@ -6,31 +6,93 @@ Based on AWHEmailScanner's upload pattern.
 """
 
 import os
+import re
+import json
+import time
 import logging
-import traceback
+import hashlib
+import tempfile
+import itertools
+from collections import OrderedDict
 from datetime import datetime
 from typing import List, Dict, Any
 from dotenv import load_dotenv
 
+# Import orjson for fast JSON serialization (falls back to stdlib json)
+try:
+    import orjson
+    ORJSON_SUPPORT = True
+except ImportError:
+    ORJSON_SUPPORT = False
+
+# Schema cache settings: choice-ID maps persisted across runs so warm
+# CLI invocations skip the startup get_fields round-trip
+SCHEMA_CACHE_PATH = os.path.join('data', 'schema_cache.json')
+SCHEMA_CACHE_MAX_AGE = 24 * 60 * 60  # 24 hours, in seconds
+
+# Trailing timezone suffix on ISO dates (DealCloud rejects it)
+_TZ_SUFFIX_RE = re.compile(r'(\+\d{2}:?\d{2}|Z)$')
+
+# Process-level schema cache keyed by (site_url, object_name): repeated
+# uploader instantiations in one run reuse the fetched field list
+# instead of repeating the HTTP round-trip
+_FIELDS_CACHE: Dict[Any, Any] = {}
+
+
+def _fetch_fields_cached(dc, site_url, object_name):
+    """
+    Fetch object fields through the process-level cache.
+
+    Args:
+        dc: DealCloud client instance
+        site_url: DealCloud site URL (cache key component)
+        object_name: API object name, e.g. 'Article'
+
+    Returns:
+        List of field models from the SDK
+    """
+    key = (site_url, object_name)
+    fields = _FIELDS_CACHE.get(key)
+    if fields is None:
+        fields = dc.get_fields(object_name)
+        _FIELDS_CACHE[key] = fields
+    return fields
+
 
 class DealCloudUploader:
     """Uploads articles to DealCloud."""
 
-    def __init__(self, logger=None):
+    # Entries memoized by article hash; sized to cover several in-flight
+    # batches of retries without growing unbounded on large jobs
+    PREPARED_CACHE_MAX = 2048
+
+    # Inner streaming chunk for upload_articles, independent of whatever
+    # batch size the caller hands in
+    UPLOAD_CHUNK_SIZE = 500
+
+    # Entry fields copied straight from the article when truthy; the
+    # multi-reference lists (Hotels/Companies/Contacts) are thereby only
+    # included when non-empty
+    _COPY_FIELDS = ('ArticleText', 'Headline', 'Hotels', 'Companies', 'Contacts')
+
+    def __init__(self, logger=None, refresh_schema=False):
         """
         Initialize the DealCloud uploader.
 
         Args:
             logger: Optional logger instance
+            refresh_schema: Force a fresh schema fetch, bypassing the
+                on-disk choice-ID cache
         """
         load_dotenv()
         self.logger = logger or self._setup_logging()
 
         # Initialize DealCloud client
+        site_url = os.getenv('DEALCLOUD_SITE_URL')
         try:
             from dealcloud_sdk import DealCloud
             self.dc = DealCloud(
-                site_url=os.getenv('DEALCLOUD_SITE_URL'),
+                site_url=site_url,
                 client_id=os.getenv('DEALCLOUD_CLIENT_ID'),
                 client_secret=os.getenv('DEALCLOUD_CLIENT_SECRET'),
             )
@@ -40,12 +102,36 @@ class DealCloudUploader:
         except Exception as e:
             raise RuntimeError(f"Failed to connect to DealCloud: {str(e)}")
 
-        # Get choice field IDs (Type and Source)
-        self.type_choice_ids = self._get_choice_ids('Type')
-        self.source_choice_ids = self._get_choice_ids('Source')
+        # Warm runs load the choice-ID maps from disk and skip the schema
+        # fetch entirely; a cold or forced-refresh run fetches the Article
+        # schema once, derives both maps, and re-primes the cache
+        self._article_fields = []
+        cached = None if refresh_schema else self._load_schema_cache()
+
+        if cached:
+            self.type_choice_ids = cached['type']
+            self.source_choice_ids = cached['source']
+        else:
+            try:
+                self._article_fields = _fetch_fields_cached(self.dc, site_url, 'Article')
+            except Exception as e:
+                self.logger.warning(f"Failed to get Article fields: {str(e)}")
+
+            # Get choice field IDs (Type and Source)
+            self.type_choice_ids = self._get_choice_ids('Type')
+            self.source_choice_ids = self._get_choice_ids('Source')
+
+            # Don't cache a failed fetch
+            if self.type_choice_ids or self.source_choice_ids:
+                self._save_schema_cache()
+
         self.logger.info(f"Type choice IDs: {self.type_choice_ids}")
         self.logger.info(f"Source choice IDs: {self.source_choice_ids}")
 
+        # LRU of entry dicts keyed by article content hash, so retried
+        # batches skip re-transforming identical articles
+        self._prepared_cache = OrderedDict()
+
     def _setup_logging(self):
         """Set up logging for the uploader."""
         today = datetime.now().strftime("%Y%m%d")
@@ -63,11 +149,60 @@ class DealCloudUploader:
 
         return logger
 
+    def _load_schema_cache(self):
+        """
+        Load the cached choice-ID maps if fresh enough.
+
+        Returns:
+            Cached dict with 'type' and 'source' maps, or None if the
+            cache is missing, stale, or malformed
+        """
+        try:
+            age = time.time() - os.stat(SCHEMA_CACHE_PATH).st_mtime
+        except OSError:
+            return None
+
+        if age > SCHEMA_CACHE_MAX_AGE:
+            return None
+
+        try:
+            with open(SCHEMA_CACHE_PATH, 'r', encoding='utf-8') as f:
+                cached = json.load(f)
+            if isinstance(cached.get('type'), dict) and isinstance(cached.get('source'), dict):
+                self.logger.info(f"Using cached schema from {SCHEMA_CACHE_PATH} ({age / 3600:.1f}h old)")
+                return cached
+        except Exception as e:
+            self.logger.warning(f"Failed to load schema cache: {e}")
+        return None
+
+    def _save_schema_cache(self):
+        """Persist the choice-ID maps atomically (best effort)."""
+        try:
+            cache_dir = os.path.dirname(SCHEMA_CACHE_PATH) or '.'
+            os.makedirs(cache_dir, exist_ok=True)
+
+            with tempfile.NamedTemporaryFile(
+                mode='w',
+                encoding='utf-8',
+                delete=False,
+                dir=cache_dir,
+                suffix='.tmp'
+            ) as tmp_file:
+                json.dump({
+                    'type': self.type_choice_ids,
+                    'source': self.source_choice_ids,
+                    'fetched_at': datetime.now().isoformat()
+                }, tmp_file, indent=2)
+                tmp_path = tmp_file.name
+
+            os.replace(tmp_path, SCHEMA_CACHE_PATH)
+        except Exception as e:
+            self.logger.warning(f"Failed to save schema cache: {e}")
+
     def _get_choice_ids(self, field_name):
-        """Get choice value IDs for a choice field."""
+        """Get choice value IDs for a choice field from the cached schema."""
         try:
-            fields = self.dc.get_fields('Article')
-            for field in fields:
+            for field in self._article_fields:
                 if field.name == field_name:
                     choice_map = {}
                     if field.choiceValues:
@@ -93,67 +228,126 @@ class DealCloudUploader:
         prepared = []
 
         for article in articles:
-            entry = {}
+            # Reuse the cached entry when the same article was already
+            # transformed (retried batches hit this every time)
+            key = self._article_cache_key(article)
+            if key is not None:
+                entry = self._prepared_cache.get(key)
+                if entry is not None:
+                    self._prepared_cache.move_to_end(key)
+                    prepared.append(entry)
+                    continue
+
+            entry = self._build_entry(article)
+
+            if key is not None:
+                self._prepared_cache[key] = entry
+                if len(self._prepared_cache) > self.PREPARED_CACHE_MAX:
+                    self._prepared_cache.popitem(last=False)
 
-            # Map fields
-            if article.get('ArticleText'):
-                entry['ArticleText'] = article['ArticleText']
+            prepared.append(entry)
 
-            if article.get('Headline'):
-                entry['Headline'] = article['Headline']
+        return prepared
 
-            # ArticleNumber from metadata
-            if article.get('_metadata') and article['_metadata'].get('article_number'):
-                entry['ArticleNumber'] = article['_metadata']['article_number']
+    @staticmethod
+    def _iter_chunks(articles, n):
+        """
+        Yield successive lists of up to n articles.
 
-            if article.get('Source'):
-                # Source is a choice field - try to map to choice value ID
-                source_name = article['Source']
-                source_id = self.source_choice_ids.get(source_name)
-                if source_id:
-                    entry['Source'] = source_id
-                else:
-                    # If source not in choices, use the first available choice
-                    # or try the source name directly (may fail)
-                    if self.source_choice_ids:
-                        # Use first choice as default
-                        default_choice_id = list(self.source_choice_ids.values())[0]
-                        entry['Source'] = default_choice_id
-                        self.logger.warning(f"Source '{source_name}' not in choices, using default")
-                    else:
-                        self.logger.warning(f"No Source choices available, skipping Source field")
-
-            if article.get('PublishDate'):
-                # Remove timezone from date (DealCloud doesn't accept it)
-                publish_date = article['PublishDate']
-                if '+' in publish_date or publish_date.endswith('Z'):
-                    # Strip timezone info
-                    publish_date = publish_date.split('+')[0].split('Z')[0]
-                entry['PublishDate'] = publish_date
-
-            # Map Type name to choice value ID
-            if article.get('Type'):
-                type_name = article['Type']
-                type_id = self.type_choice_ids.get(type_name)
-                if type_id:
-                    entry['Type'] = type_id
-                else:
-                    self.logger.warning(f"Unknown Type value: {type_name}")
+        Args:
+            articles: Iterable of articles
+            n: Chunk size
 
-            # Multi-reference fields (Hotels, Companies, Contacts)
-            # Only include if not empty
-            if article.get('Hotels'):
-                entry['Hotels'] = article['Hotels']
+        Yields:
+            Lists of at most n articles
+        """
+        it = iter(articles)
+        while chunk := list(itertools.islice(it, n)):
+            yield chunk
 
-            if article.get('Companies'):
-                entry['Companies'] = article['Companies']
+    @staticmethod
+    def _article_cache_key(article):
+        """
+        Stable content hash for an article, or None if unhashable.
 
-            if article.get('Contacts'):
-                entry['Contacts'] = article['Contacts']
+        Args:
+            article: Prepared article dict (or PreparedArticle)
 
-            prepared.append(entry)
+        Returns:
+            Digest bytes usable as a cache key, or None
+        """
+        raw = article.to_dict() if hasattr(article, 'to_dict') else article
+        try:
+            if ORJSON_SUPPORT:
+                payload = orjson.dumps(raw, option=orjson.OPT_SORT_KEYS | orjson.OPT_NON_STR_KEYS)
+            else:
+                payload = json.dumps(raw, sort_keys=True, default=str).encode('utf-8')
+        except TypeError:
+            return None
+        return hashlib.blake2b(payload, digest_size=16).digest()
+
+    def _build_entry(self, article: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Convert one prepared article to DealCloud entry format.
 
-        return prepared
+        Args:
+            article: Prepared article from ArticlePreparator
+
+        Returns:
+            Dict in DealCloud entry format
+        """
+        entry = {}
+
+        # Bind the mapping lookup once; each article hits it repeatedly
+        get = article.get
+
+        # Pass-through fields, copied when truthy (multi-reference lists
+        # are only included when non-empty)
+        for name in self._COPY_FIELDS:
+            value = get(name)
+            if value:
+                entry[name] = value
+
+        # ArticleNumber from metadata
+        metadata = get('_metadata')
+        if metadata:
+            article_number = metadata.get('article_number')
+            if article_number:
+                entry['ArticleNumber'] = article_number
+
+        source_name = get('Source')
+        if source_name:
+            # Source is a choice field - try to map to choice value ID
+            source_id = self.source_choice_ids.get(source_name)
+            if source_id:
+                entry['Source'] = source_id
+            else:
+                # If source not in choices, use the first available choice
+                # or try the source name directly (may fail)
+                if self.source_choice_ids:
+                    # Use first choice as default
+                    default_choice_id = list(self.source_choice_ids.values())[0]
+                    entry['Source'] = default_choice_id
+                    self.logger.warning(f"Source '{source_name}' not in choices, using default")
+                else:
+                    self.logger.warning(f"No Source choices available, skipping Source field")
+
+        publish_date = get('PublishDate')
+        if publish_date:
+            # Remove timezone from date (DealCloud doesn't accept it);
+            # one anchored substitution, no intermediate split lists
+            entry['PublishDate'] = _TZ_SUFFIX_RE.sub('', publish_date)
+
+        # Map Type name to choice value ID
+        type_name = get('Type')
+        if type_name:
+            type_id = self.type_choice_ids.get(type_name)
+            if type_id:
+                entry['Type'] = type_id
+            else:
+                self.logger.warning(f"Unknown Type value: {type_name}")
+
+        return entry
 
     def upload_articles(self, articles: List[Dict[str, Any]]) -> Dict[str, Any]:
         """
@@ -178,45 +372,52 @@ class DealCloudUploader:
         total = len(articles)
         self.logger.info(f"Starting upload of {total} articles to DealCloud")
 
+        # Stream in fixed-size chunks: only one chunk's articles, entries
+        # and responses are alive at once, so peak memory tracks the
+        # chunk size rather than the whole job
+        uploaded = 0
+        failed = 0
+        entry_ids = []
+        error_messages = []
+
         try:
-            # Prepare articles for upload
-            prepared_articles = self._prepare_articles_for_upload(articles)
-
-            # Upload to DealCloud
-            responses = self.dc.insert_data('Article', prepared_articles)
-
-            # Process responses
-            uploaded = 0
-            failed = 0
-            entry_ids = []
-            error_messages = []
-
-            for i, response in enumerate(responses):
-                if isinstance(response, dict):
-                    # Check for errors
-                    if 'Errors' in response and response['Errors']:
-                        failed += 1
-                        error_details = []
-                        for error in response['Errors']:
-                            error_details.append(
-                                f"Field: {error.get('field', 'Unknown')}, "
-                                f"Code: {error.get('code', 'Unknown')}, "
-                                f"Description: {error.get('description', 'Unknown')}"
-                            )
-
-                        headline = articles[i].get('Headline', 'Unknown')[:50]
-                        error_msg = f"Error uploading '{headline}': {', '.join(error_details)}"
-                        error_messages.append(error_msg)
-                        self.logger.error(error_msg)
-                    else:
-                        # Success
-                        uploaded += 1
-                        entry_id = response.get('EntryId')
-                        if entry_id:
-                            entry_ids.append(entry_id)
-
-                        headline = articles[i].get('Headline', 'Unknown')[:50]
-                        self.logger.info(f"Uploaded: {headline} (ID: {entry_id})")
+            for chunk in self._iter_chunks(articles, self.UPLOAD_CHUNK_SIZE):
+                # Prepare articles for upload
+                prepared_chunk = self._prepare_articles_for_upload(chunk)
+
+                # Upload to DealCloud
+                responses = self.dc.insert_data('Article', prepared_chunk)
+
+                # Process responses
+                for i, response in enumerate(responses):
+                    if isinstance(response, dict):
+                        # Check for errors
+                        if 'Errors' in response and response['Errors']:
+                            failed += 1
+                            error_details = []
+                            for error in response['Errors']:
+                                error_details.append(
+                                    f"Field: {error.get('field', 'Unknown')}, "
+                                    f"Code: {error.get('code', 'Unknown')}, "
+                                    f"Description: {error.get('description', 'Unknown')}"
+                                )
+
+                            headline = chunk[i].get('Headline', 'Unknown')[:50]
+                            error_msg = f"Error uploading '{headline}': {', '.join(error_details)}"
+                            error_messages.append(error_msg)
+                            self.logger.error(error_msg)
+                        else:
+                            # Success
+                            uploaded += 1
+                            entry_id = response.get('EntryId')
+                            if entry_id:
+                                entry_ids.append(entry_id)
+
+                            headline = chunk[i].get('Headline', 'Unknown')[:50]
+                            self.logger.info(f"Uploaded: {headline} (ID: {entry_id})")
+
+                # Drop chunk-local structures before drawing the next chunk
+                del prepared_chunk, responses
 
             # Summary
             stats = {
@@ -236,15 +437,17 @@ class DealCloudUploader:
 
         except Exception as e:
             error_msg = f"Error uploading to DealCloud: {str(e)}"
-            self.logger.error(error_msg)
-            self.logger.error(traceback.format_exc())
+            # exception() defers traceback formatting to the handler, so
+            # the stack is only rendered when the record is emitted
+            self.logger.exception(error_msg)
 
+            # Chunks completed before the failure still count
             return {
                 'total_articles': total,
-                'uploaded': 0,
-                'failed': total,
-                'entry_ids': [],
-                'success_rate': 0,
+                'uploaded': uploaded,
+                'failed': total - uploaded,
+                'entry_ids': entry_ids,
+                'success_rate': (uploaded / total * 100) if total > 0 else 0,
                 'error': error_msg
             }
 
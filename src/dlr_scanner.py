@@ -11,22 +11,100 @@ Usage:
 
 import os
 import sys
+import queue
+import atexit
 import argparse
 import logging
+import functools
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from logging.handlers import QueueHandler, QueueListener
 from datetime import datetime
 from dotenv import load_dotenv
 
 # Add src directory to path for imports
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 
-from gmx_fetcher import GmxFetcher
-from newsletter_parser import NewsletterParser
-from newsletter_parser_deterministic import DeterministicNewsletterParser
-from entity_extractor import EntityExtractor
-from validation_orchestrator import ValidationOrchestrator
-from article_preparator import ArticlePreparator
-from report_generator import ReportGenerator
-from dealcloud_uploader import DealCloudUploader
+# Component classes are imported inside the properties that build them:
+# they transitively pull in the Gemini SDK, IMAP/chardet, and the
+# DealCloud SDK, so importing all of them up front dominates cold-start
+# for paths (--help, short runs) that never touch most of the pipeline
+
+# Zeroed validation summary, shared by the skip-validation path and
+# empty-run reports instead of rebuilding the literal each time; callers
+# copy before embedding so report consumers can't mutate the template
+_EMPTY_VALIDATION_SUMMARY = {
+    "total_hotels": 0, "matched_hotels": 0, "hotel_match_rate": 0,
+    "total_companies": 0, "matched_companies": 0, "company_match_rate": 0,
+    "total_contacts": 0, "matched_contacts": 0, "contact_match_rate": 0
+}
+
+# Companion zeroed templates for empty/failed-run reports, built once at
+# import instead of as literals inside _generate_empty_report
+_EMPTY_PARSER_STATS = {
+    "newsletters_processed": 0, "articles_extracted": 0,
+    "failed_processing": 0, "failed_newsletters": []
+}
+
+_EMPTY_EXTRACTOR_STATS = {
+    "articles_processed": 0, "hotels_extracted": 0, "companies_extracted": 0,
+    "contacts_extracted": 0, "failed_processing": 0, "failed_articles": []
+}
+
+_EMPTY_PREPARED_SUMMARY = {
+    "total_articles": 0, "articles_with_hotels": 0, "articles_with_companies": 0,
+    "articles_with_contacts": 0, "total_hotel_references": 0,
+    "total_company_references": 0, "total_contact_references": 0,
+    "unique_sources": []
+}
+
+# Component instances shared across DLRScanner objects. Embedded callers
+# (schedulers, tests) construct the scanner repeatedly, and rebuilding
+# the fetcher/extractor/validator each time re-pays model, connection,
+# and cache warm-up; instances are memoized here instead and handed out
+# by the properties. Keys carry the config that affects construction
+# (parser choice, article type), so differently-configured scanners
+# never share the wrong instance
+_component_lock = threading.Lock()
+_shared_components = {}
+
+
+def _get_component(key, factory):
+    """Return the shared component for key, building it once under the lock."""
+    with _component_lock:
+        if key not in _shared_components:
+            _shared_components[key] = factory()
+        return _shared_components[key]
+
+
+def reset_singletons():
+    """Drop all shared component instances (for test isolation)."""
+    with _component_lock:
+        _shared_components.clear()
+
+
+_LOG_FORMATTER = logging.Formatter('%(asctime)s - %(levelname)s - %(message)s')
+
+
+@functools.lru_cache(maxsize=4)
+def _get_daily_handlers(yyyymmdd):
+    """
+    File and console handlers for one day's log, built once per date.
+
+    Long-running hosts construct scanners repeatedly; memoizing on the
+    date string means the makedirs and log-file open() happen once per
+    day instead of per instantiation, while still rolling to a fresh
+    file when the date changes.
+    """
+    os.makedirs("logs", exist_ok=True)
+
+    file_handler = logging.FileHandler(f"logs/dlr_scanner_{yyyymmdd}.log")
+    file_handler.setFormatter(_LOG_FORMATTER)
+
+    console_handler = logging.StreamHandler()
+    console_handler.setFormatter(_LOG_FORMATTER)
+
+    return file_handler, console_handler
 
 
 class DLRScanner:
@@ -42,19 +120,24 @@ class DLRScanner:
             article_type: Type of articles - "Actual" or "Testing" (default from ARTICLE_TYPE env var or "Testing")
             logger: Optional logger instance
         """
-        load_dotenv()
+        # .env is read lazily in run(): construction-only paths (--help,
+        # tests) should not pay the file stat + parse
+        self._dotenv_loaded = False
         self.logger = logger or self._setup_logging()
 
-        # Configuration
+        # Configuration; env defaults pull in .env first
         if use_deterministic_parser is None:
+            self._ensure_dotenv()
             use_deterministic_parser = os.getenv('USE_DETERMINISTIC_PARSER', 'true').lower() == 'true'
         self.use_deterministic_parser = use_deterministic_parser
 
         if batch_size is None:
+            self._ensure_dotenv()
             batch_size = int(os.getenv('ENTITY_EXTRACTION_BATCH_SIZE', '10'))
         self.batch_size = batch_size
 
         if article_type is None:
+            self._ensure_dotenv()
             article_type = os.getenv('ARTICLE_TYPE', 'Testing')
         self.article_type = article_type
 
@@ -67,76 +150,119 @@ class DLRScanner:
         self._reporter = None
         self._uploader = None
 
-    def _setup_logging(self):
-        """Set up logging for the scanner."""
-        today = datetime.now().strftime("%Y%m%d")
+    @staticmethod
+    def _snapshot_stats(stats):
+        """
+        Record counters (and list lengths) from a component's stats.
 
-        # Ensure logs directory exists
-        os.makedirs("logs", exist_ok=True)
+        Components are process-wide singletons, so their stats accumulate
+        across runs; a snapshot taken before a step lets run() report
+        only this run's share.
+        """
+        return {
+            key: len(value) if isinstance(value, list) else value
+            for key, value in stats.items()
+        }
+
+    @staticmethod
+    def _stats_delta(snapshot, stats):
+        """Subtract a stats snapshot from cumulative totals."""
+        return {
+            key: value[snapshot.get(key, 0):] if isinstance(value, list)
+            else value - snapshot.get(key, 0)
+            for key, value in stats.items()
+        }
+
+    def _ensure_dotenv(self):
+        """Load .env once, the first time environment config is consulted."""
+        if not self._dotenv_loaded:
+            load_dotenv()
+            self._dotenv_loaded = True
 
+    def _setup_logging(self):
+        """Set up logging for the scanner."""
         logger = logging.getLogger('dlr_scanner')
         logger.setLevel(logging.INFO)
 
         if not logger.handlers:
-            formatter = logging.Formatter('%(asctime)s - %(levelname)s - %(message)s')
-
-            # File handler
-            file_handler = logging.FileHandler(f"logs/dlr_scanner_{today}.log")
-            file_handler.setFormatter(formatter)
-            logger.addHandler(file_handler)
-
-            # Console handler
-            console_handler = logging.StreamHandler()
-            console_handler.setFormatter(formatter)
-            logger.addHandler(console_handler)
+            # Handlers are memoized on the date, so repeat scanner
+            # construction reuses today's open log file
+            today = datetime.now().strftime("%Y%m%d")
+            file_handler, console_handler = _get_daily_handlers(today)
+
+            # Records go onto an in-memory queue and a background thread
+            # does the formatting and write() calls, so pipeline steps
+            # never block on log I/O. The listener drains the queue for
+            # the life of the process and is flushed at interpreter exit
+            log_queue = queue.SimpleQueue()
+            logger.addHandler(QueueHandler(log_queue))
+
+            self._log_listener = QueueListener(
+                log_queue, file_handler, console_handler,
+                respect_handler_level=True
+            )
+            self._log_listener.start()
+            atexit.register(self._log_listener.stop)
 
         return logger
 
     @property
     def fetcher(self):
         if self._fetcher is None:
-            self._fetcher = GmxFetcher(logger=self.logger)
+            from gmx_fetcher import GmxFetcher
+            self._fetcher = _get_component('fetcher', lambda: GmxFetcher(logger=self.logger))
         return self._fetcher
 
     @property
     def parser(self):
         if self._parser is None:
             if self.use_deterministic_parser:
-                self._parser = DeterministicNewsletterParser(logger=self.logger)
+                from newsletter_parser_deterministic import DeterministicNewsletterParser
+                self._parser = _get_component(
+                    ('parser', True), lambda: DeterministicNewsletterParser(logger=self.logger))
                 self.logger.info("Using deterministic (pattern-based) newsletter parser")
             else:
-                self._parser = NewsletterParser(logger=self.logger)
+                from newsletter_parser import NewsletterParser
+                self._parser = _get_component(
+                    ('parser', False), lambda: NewsletterParser(logger=self.logger))
                 self.logger.info("Using AI-based newsletter parser")
         return self._parser
 
     @property
     def extractor(self):
         if self._extractor is None:
-            self._extractor = EntityExtractor(logger=self.logger)
+            from entity_extractor import EntityExtractor
+            self._extractor = _get_component('extractor', lambda: EntityExtractor(logger=self.logger))
         return self._extractor
 
     @property
     def validator(self):
         if self._validator is None:
-            self._validator = ValidationOrchestrator(logger=self.logger)
+            from validation_orchestrator import ValidationOrchestrator
+            self._validator = _get_component('validator', lambda: ValidationOrchestrator(logger=self.logger))
         return self._validator
 
     @property
     def preparator(self):
         if self._preparator is None:
-            self._preparator = ArticlePreparator(article_type=self.article_type, logger=self.logger)
+            from article_preparator import ArticlePreparator
+            self._preparator = _get_component(
+                ('preparator', self.article_type),
+                lambda: ArticlePreparator(article_type=self.article_type, logger=self.logger))
         return self._preparator
 
     @property
     def reporter(self):
         if self._reporter is None:
-            self._reporter = ReportGenerator(logger=self.logger)
+            from report_generator import ReportGenerator
+            self._reporter = _get_component('reporter', lambda: ReportGenerator(logger=self.logger))
         return self._reporter
 
     @property
     def uploader(self):
         if self._uploader is None:
-            self._uploader = DealCloudUploader(logger=self.logger)
+            from dealcloud_uploader import DealCloudUploader
+            self._uploader = _get_component('uploader', lambda: DealCloudUploader(logger=self.logger))
         return self._uploader
 
     def run(
@@ -164,6 +290,8 @@ class DLRScanner:
         Returns:
             Tuple of (prepared_articles, report)
         """
+        self._ensure_dotenv()
+
         start_time = datetime.now()
         self.logger.info("=" * 60)
         self.logger.info("Starting DLRScanner Pipeline")
@@ -173,37 +301,63 @@ class DLRScanner:
         days_back = days_back or int(os.getenv('DAYS_BACK', 1))
         limit = limit or int(os.getenv('EMAIL_FETCH_COUNT', 10))
 
-        # Parse sender filter from env if not provided
+        # Parse sender filter from env if not provided; frozenset drops
+        # duplicate entries before the fetcher builds its matcher
         if sender_filter is None:
             filter_str = os.getenv('NEWSLETTER_SOURCES', '')
             if filter_str:
-                sender_filter = [s.strip() for s in filter_str.split(',') if s.strip()]
+                sender_filter = frozenset(s.strip() for s in filter_str.split(',') if s.strip())
 
-        # Step 1: Fetch emails
+        # Steps 1+2 run as a two-stage pipeline: a background thread
+        # streams emails from IMAP onto a bounded queue while this thread
+        # parses each one as it arrives, so the per-message network
+        # round-trips are hidden behind the CPU-bound parse instead of
+        # being paid up front as a bulk-fetch barrier
         self.logger.info(f"Step 1: Fetching emails (days_back={days_back}, limit={limit})")
-        try:
-            emails = self.fetcher.fetch_stored_emails(
-                days_back=days_back,
-                limit=limit,
-                sender_filter=sender_filter
-            )
-            emails_fetched = len(emails)
-            self.logger.info(f"Fetched {emails_fetched} emails")
-        except Exception as e:
-            self.logger.error(f"Error fetching emails: {e}")
-            emails = []
-            emails_fetched = 0
-
-        if not emails:
+        self.logger.info("Step 2: Parsing newsletters as they arrive")
+
+        email_queue = queue.Queue(maxsize=max(2, self.batch_size))
+        fetch_done = object()
+
+        def fetch_into_queue():
+            try:
+                for item in self.fetcher.iter_stored_emails(
+                    days_back=days_back,
+                    limit=limit,
+                    sender_filter=sender_filter
+                ):
+                    email_queue.put(item)
+            except Exception as e:
+                self.logger.error(f"Error fetching emails: {e}")
+            finally:
+                email_queue.put(fetch_done)
+
+        fetch_thread = threading.Thread(target=fetch_into_queue, daemon=True)
+        fetch_thread.start()
+
+        # Shared components keep cumulative stats; snapshot before the
+        # step so the report covers this run only
+        parser_stats_start = self._snapshot_stats(self.parser.get_stats())
+
+        emails_fetched = 0
+        articles = []
+        while True:
+            item = email_queue.get()
+            if item is fetch_done:
+                break
+            emails_fetched += 1
+            articles.extend(self.parser.parse_newsletter(*item))
+        fetch_thread.join()
+
+        self.logger.info(f"Fetched {emails_fetched} emails")
+
+        if not emails_fetched:
             self.logger.warning("No emails to process")
             end_time = datetime.now()
             report = self._generate_empty_report(start_time, end_time)
             return [], report
 
-        # Step 2: Parse newsletters into articles
-        self.logger.info("Step 2: Parsing newsletters into articles")
-        articles = self.parser.parse_newsletters(emails)
-        parser_stats = self.parser.get_stats()
+        parser_stats = self._stats_delta(parser_stats_start, self.parser.get_stats())
         self.logger.info(f"Extracted {len(articles)} articles")
 
         if not articles:
@@ -214,24 +368,19 @@ class DLRScanner:
 
         # Step 3: Extract entities from articles
         self.logger.info(f"Step 3: Extracting entities from articles (batch_size={self.batch_size})")
+        extractor_stats_start = self._snapshot_stats(self.extractor.get_stats())
         articles_with_entities = self.extractor.extract_from_articles_batched(articles, batch_size=self.batch_size)
-        extractor_stats = self.extractor.get_stats()
+        extractor_stats = self._stats_delta(extractor_stats_start, self.extractor.get_stats())
         self.logger.info(f"Entity extraction complete")
 
         # Step 4: Validate entities (optional)
         if skip_validation:
             self.logger.info("Step 4: Skipping validation (--no-validate)")
+            # No per-article placeholder lists: ArticlePreparator treats
+            # missing *_entry_ids the same as all-None (filtered to []),
+            # so the articles pass through untouched
             validated_articles = articles_with_entities
-            # Add empty entry IDs
-            for article in validated_articles:
-                article["hotel_entry_ids"] = [None] * len(article.get("hotels", []))
-                article["company_entry_ids"] = [None] * len(article.get("companies", []))
-                article["contact_entry_ids"] = [None] * len(article.get("contacts", []))
-            validation_summary = {
-                "total_hotels": 0, "matched_hotels": 0, "hotel_match_rate": 0,
-                "total_companies": 0, "matched_companies": 0, "company_match_rate": 0,
-                "total_contacts": 0, "matched_contacts": 0, "contact_match_rate": 0
-            }
+            validation_summary = dict(_EMPTY_VALIDATION_SUMMARY)
         else:
             self.logger.info("Step 4: Validating entities against DealCloud")
             validated_articles = self.validator.validate_articles(articles_with_entities)
@@ -243,16 +392,29 @@ class DLRScanner:
         prepared_articles = self.preparator.prepare_articles(validated_articles)
         prepared_summary = self.preparator.get_summary(prepared_articles)
 
-        # Export to JSON
-        export_path = self.preparator.export_to_json(prepared_articles, output_path)
-        self.logger.info(f"Exported articles to {export_path}")
+        # Export to JSON on a worker thread: the write shares no mutable
+        # state with the upload/report steps below, so its disk I/O
+        # overlaps them instead of serializing in front
+        export_executor = ThreadPoolExecutor(max_workers=1)
+        export_future = export_executor.submit(
+            self.preparator.export_to_json, prepared_articles, output_path)
+        export_executor.shutdown(wait=False)
 
         # Step 6: Upload to DealCloud (optional)
         upload_stats = None
         if upload:
             self.logger.info("Step 6: Uploading articles to DealCloud")
             try:
-                upload_stats = self.uploader.upload_articles(prepared_articles)
+                # BatchUploader overlaps up to UPLOAD_CONCURRENCY batches
+                # with retry/backoff and checkpointing, so the upload is
+                # no longer a serial chain of HTTP round-trips
+                from batch_uploader import upload_with_batching
+                upload_stats = upload_with_batching(
+                    prepared_articles,
+                    dealcloud_uploader=self.uploader,
+                    max_concurrency=int(os.getenv('UPLOAD_CONCURRENCY', '8')),
+                    logger=self.logger
+                )
                 self.logger.info(f"Upload complete: {upload_stats['uploaded']}/{upload_stats['total_articles']} articles uploaded")
             except Exception as e:
                 self.logger.error(f"Upload failed: {str(e)}")
@@ -285,6 +447,10 @@ class DLRScanner:
             self.reporter.save_report(report)
             self.reporter.print_report(report)
 
+        # Join the background export before returning
+        export_path = export_future.result()
+        self.logger.info(f"Exported articles to {export_path}")
+
         self.logger.info("=" * 60)
         self.logger.info("DLRScanner Pipeline Complete")
         self.logger.info("=" * 60)
@@ -295,10 +461,10 @@ class DLRScanner:
         """Generate a report for empty/failed runs."""
         return self.reporter.generate_processing_report(
             emails_fetched=emails_fetched,
-            parser_stats=parser_stats or {"newsletters_processed": 0, "articles_extracted": 0, "failed_processing": 0, "failed_newsletters": []},
-            extractor_stats={"articles_processed": 0, "hotels_extracted": 0, "companies_extracted": 0, "contacts_extracted": 0, "failed_processing": 0, "failed_articles": []},
-            validation_summary={"total_hotels": 0, "matched_hotels": 0, "hotel_match_rate": 0, "total_companies": 0, "matched_companies": 0, "company_match_rate": 0, "total_contacts": 0, "matched_contacts": 0, "contact_match_rate": 0},
-            prepared_summary={"total_articles": 0, "articles_with_hotels": 0, "articles_with_companies": 0, "articles_with_contacts": 0, "total_hotel_references": 0, "total_company_references": 0, "total_contact_references": 0, "unique_sources": []},
+            parser_stats=parser_stats or dict(_EMPTY_PARSER_STATS),
+            extractor_stats=dict(_EMPTY_EXTRACTOR_STATS),
+            validation_summary=dict(_EMPTY_VALIDATION_SUMMARY),
+            prepared_summary=dict(_EMPTY_PREPARED_SUMMARY),
             start_time=start_time,
             end_time=end_time
         )
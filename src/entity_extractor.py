@@ -5,14 +5,57 @@ Uses Gemini AI to extract hotels, companies, and contacts from articles.
 """
 
 import os
+import re
 import json
+import time
+import random
 import logging
+import functools
+import threading
 import traceback
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 import google.generativeai as genai
 import typing_extensions as typing
 from dotenv import load_dotenv
 
+# Import orjson for fast JSON parsing (falls back to stdlib json)
+try:
+    import orjson
+    ORJSON_SUPPORT = True
+except ImportError:
+    ORJSON_SUPPORT = False
+
+
+def _loads(text):
+    """
+    Parse a JSON response body, with orjson when available.
+
+    orjson raises a JSONDecodeError subclass, so callers' except clauses
+    work unchanged either way.
+    """
+    if ORJSON_SUPPORT:
+        return orjson.loads(text)
+    return json.loads(text)
+
+
+# Cheap pre-filter for articles that cannot contain extractable
+# entities (e.g. pure stock-ticker or market summaries): if none of
+# these hospitality, corporate, or personnel tokens appear, the Gemini
+# call is skipped and an empty result returned. Compiled once at import
+_ENTITY_CANDIDATE_RE = re.compile(
+    r"\b("
+    r"hotel|hotels|resort|resorts|inn|suites|lodge|lodging|motel|casino|hostel|"
+    r"marriott|hilton|hyatt|wyndham|accor|radisson|sheraton|westin|ritz|kimpton|sonesta|"
+    r"company|companies|inc|llc|corp|group|partners|capital|reit|brand|franchise|"
+    r"acqui\w*|sold|sale|purchas\w*|develop\w*|invest\w*|manag\w*|operat\w*|own\w*|"
+    r"ceo|cfo|coo|president|chairman|chairwoman|director|executive|founder|principal|"
+    r"appoint\w*|named|hired|promot\w*|join\w*"
+    r")\b",
+    re.IGNORECASE
+)
+
 
 class HotelEntity(typing.TypedDict):
     """Schema for extracted hotel."""
@@ -43,6 +86,15 @@ class ArticleEntities(typing.TypedDict):
 
 
 class EntityExtractor:
+    # Maximum number of per-article results kept in the in-memory cache
+    ENTITY_CACHE_MAX = 200_000
+
+    # Retry schedule for rate-limited Gemini calls: jittered exponential
+    # backoff, capped
+    MAX_RETRIES = 3
+    RETRY_BASE_DELAY = 2.0
+    RETRY_MAX_DELAY = 30.0
+
     def __init__(self, api_key=None, model_name=None, instructions_path=None, logger=None):
         """
         Initialize the Entity Extractor.
@@ -76,15 +128,28 @@ class EntityExtractor:
         # Set up logging
         self.logger = logger or self._setup_logging()
 
-        # Statistics
-        self.stats = {
+        # Statistics; a Counter so the per-article increments land as a
+        # single C-level update instead of four dict lookups each
+        self.stats = Counter({
             "articles_processed": 0,
             "hotels_extracted": 0,
             "companies_extracted": 0,
             "contacts_extracted": 0,
             "failed_processing": 0,
-            "failed_articles": []
-        }
+            "cache_hits": 0,
+            "skipped_no_candidates": 0
+        })
+        self.stats["failed_articles"] = []
+
+        # Memoized extraction results keyed by (headline, article_text).
+        # Newsletters repeat articles across digests, so cache hits skip the
+        # Gemini call entirely. Only successful extractions are cached.
+        self._entity_cache = {}
+
+        # Batches dispatched in parallel when there is more than one;
+        # the lock guards stats and cache updates from worker threads
+        self.extract_concurrency = int(os.getenv('EXTRACT_CONCURRENCY', '8'))
+        self._lock = threading.Lock()
 
     def _setup_logging(self):
         """Set up logging for the extractor."""
@@ -114,6 +179,44 @@ Return JSON with: hotels (name, city, state), companies (name, role), contacts (
         except Exception:
             return ""
 
+    def _cache_key(self, article):
+        """Cache key for an article's extraction result."""
+        return (article.get('headline', ''), article.get('article_text', ''))
+
+    def _cache_entities(self, article, hotels, companies, contacts):
+        """Store a successful extraction result in the cache."""
+        with self._lock:
+            if len(self._entity_cache) < self.ENTITY_CACHE_MAX:
+                self._entity_cache[self._cache_key(article)] = {
+                    "hotels": hotels,
+                    "companies": companies,
+                    "contacts": contacts
+                }
+
+    def _cached_entities(self, article):
+        """
+        Look up a cached extraction result for an article.
+
+        Returns:
+            Article dict with cached entities added, or None on cache miss
+        """
+        cached = self._entity_cache.get(self._cache_key(article))
+        if cached is None:
+            return None
+
+        # Reached from pool worker threads via extract_entities, so the
+        # update needs the stats lock like every other mutation here
+        with self._lock:
+            self.stats.update({
+                "cache_hits": 1,
+                "articles_processed": 1,
+                "hotels_extracted": len(cached["hotels"]),
+                "companies_extracted": len(cached["companies"]),
+                "contacts_extracted": len(cached["contacts"])
+            })
+
+        return {**article, **cached}
+
     def extract_entities(self, article):
         """
         Extract entities from a single article.
@@ -124,6 +227,10 @@ Return JSON with: hotels (name, city, state), companies (name, role), contacts (
         Returns:
             Dict with 'hotels', 'companies', 'contacts' lists, plus original article data
         """
+        cached_result = self._cached_entities(article)
+        if cached_result is not None:
+            return cached_result
+
         headline = article.get('headline', 'Unknown')
         article_text = article.get('article_text', '')
 
@@ -143,8 +250,26 @@ Return JSON with: hotels (name, city, state), companies (name, role), contacts (
                 "contacts": []
             }
 
-        # Construct prompt
-        prompt = self.instructions + f"\n\nArticle Headline: {headline}\n\nArticle Text:\n{article_text}"
+        # Articles with no candidate tokens at all cannot yield entities;
+        # a microsecond regex scan replaces the API round-trip for them
+        if not _ENTITY_CANDIDATE_RE.search(headline) and not _ENTITY_CANDIDATE_RE.search(article_text):
+            self.logger.info(f"No entity-candidate tokens, skipping Gemini call for: {headline[:50]}...")
+            with self._lock:
+                self.stats["skipped_no_candidates"] += 1
+            return {
+                **article,
+                "hotels": [],
+                "companies": [],
+                "contacts": []
+            }
+
+        # The multi-KB instructions prefix is passed as its own content
+        # part, so only the short per-article tail is allocated per call
+        # instead of re-copying the instructions into every prompt
+        prompt = [
+            self.instructions,
+            f"\n\nArticle Headline: {headline}\n\nArticle Text:\n{article_text}"
+        ]
 
         try:
             response = self.model.generate_content(
@@ -164,7 +289,7 @@ Return JSON with: hotels (name, city, state), companies (name, role), contacts (
                     "contacts": []
                 }
 
-            entities = json.loads(response.text)
+            entities = _loads(response.text)
 
             # Ensure all required keys exist
             hotels = entities.get('hotels', [])
@@ -172,16 +297,21 @@ Return JSON with: hotels (name, city, state), companies (name, role), contacts (
             contacts = entities.get('contacts', [])
 
             # Update statistics
-            self.stats["articles_processed"] += 1
-            self.stats["hotels_extracted"] += len(hotels)
-            self.stats["companies_extracted"] += len(companies)
-            self.stats["contacts_extracted"] += len(contacts)
+            with self._lock:
+                self.stats.update({
+                    "articles_processed": 1,
+                    "hotels_extracted": len(hotels),
+                    "companies_extracted": len(companies),
+                    "contacts_extracted": len(contacts)
+                })
 
             self.logger.info(
                 f"Extracted from '{headline[:30]}...': "
                 f"{len(hotels)} hotels, {len(companies)} companies, {len(contacts)} contacts"
             )
 
+            self._cache_entities(article, hotels, companies, contacts)
+
             # Return combined article data with entities
             return {
                 **article,
@@ -193,8 +323,9 @@ Return JSON with: hotels (name, city, state), companies (name, role), contacts (
         except json.JSONDecodeError as e:
             self.logger.error(f"JSON parsing error for {headline}: {e}")
             self.logger.error(traceback.format_exc())
-            self.stats["failed_processing"] += 1
-            self.stats["failed_articles"].append(f"{headline} - JSON error")
+            with self._lock:
+                self.stats["failed_processing"] += 1
+                self.stats["failed_articles"].append(f"{headline} - JSON error")
             return {
                 **article,
                 "hotels": [],
@@ -205,8 +336,9 @@ Return JSON with: hotels (name, city, state), companies (name, role), contacts (
         except Exception as e:
             self.logger.error(f"Error extracting entities from {headline}: {e}")
             self.logger.error(traceback.format_exc())
-            self.stats["failed_processing"] += 1
-            self.stats["failed_articles"].append(f"{headline} - Processing error")
+            with self._lock:
+                self.stats["failed_processing"] += 1
+                self.stats["failed_articles"].append(f"{headline} - Processing error")
             return {
                 **article,
                 "hotels": [],
@@ -224,11 +356,17 @@ Return JSON with: hotels (name, city, state), companies (name, role), contacts (
         Returns:
             List of articles with extracted entities
         """
-        results = []
-
-        for article in articles:
-            result = self.extract_entities(article)
-            results.append(result)
+        articles = list(articles)
+
+        # Each call is dominated by the Gemini round-trip, so in-flight
+        # requests overlap on a thread pool (same approach as the batched
+        # path); executor.map preserves input order
+        if len(articles) <= 1:
+            results = [self.extract_entities(article) for article in articles]
+        else:
+            workers = min(len(articles), self.extract_concurrency)
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                results = list(executor.map(self.extract_entities, articles))
 
         self.logger.info(
             f"Entity extraction complete: {self.stats['articles_processed']} articles, "
@@ -256,21 +394,58 @@ Return JSON with: hotels (name, city, state), companies (name, role), contacts (
         if not articles:
             return []
 
-        results = []
         total_articles = len(articles)
+        results = [None] * total_articles
+
+        # Serve repeated articles from the cache and short-circuit
+        # articles with no entity-candidate tokens; only the rest go to
+        # Gemini
+        uncached = []
+        for i, article in enumerate(articles):
+            cached_result = self._cached_entities(article)
+            if cached_result is not None:
+                results[i] = cached_result
+            elif not _ENTITY_CANDIDATE_RE.search(article.get('headline', '')) and \
+                    not _ENTITY_CANDIDATE_RE.search(article.get('article_text', '')):
+                self.stats["skipped_no_candidates"] += 1
+                results[i] = {
+                    **article,
+                    "hotels": [],
+                    "companies": [],
+                    "contacts": []
+                }
+            else:
+                uncached.append((i, article))
 
-        # Process articles in batches
-        for batch_start in range(0, total_articles, batch_size):
-            batch_end = min(batch_start + batch_size, total_articles)
-            batch = articles[batch_start:batch_end]
+        if len(uncached) < total_articles:
+            self.logger.info(
+                f"Entity cache served {total_articles - len(uncached)}/{total_articles} articles"
+            )
+
+        # Process remaining articles in batches. Each batch is one
+        # Gemini call that spends most of its time waiting on the API,
+        # so multiple batches overlap their round-trips on a thread pool
+        batches = [uncached[i:i + batch_size] for i in range(0, len(uncached), batch_size)]
 
+        if len(batches) <= 1:
+            batch_results_list = [
+                self._extract_entities_batch([article for _, article in pairs])
+                for pairs in batches
+            ]
+        else:
+            workers = min(len(batches), self.extract_concurrency)
             self.logger.info(
-                f"Processing batch {batch_start // batch_size + 1}: "
-                f"articles {batch_start + 1}-{batch_end} of {total_articles}"
+                f"Dispatching {len(batches)} extraction batches across {workers} workers"
             )
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                batch_results_list = list(executor.map(
+                    self._extract_entities_batch,
+                    [[article for _, article in pairs] for pairs in batches]
+                ))
 
-            batch_results = self._extract_entities_batch(batch)
-            results.extend(batch_results)
+        for pairs, batch_results in zip(batches, batch_results_list):
+            for (i, _), result in zip(pairs, batch_results):
+                results[i] = result
 
         self.logger.info(
             f"Batch entity extraction complete: {self.stats['articles_processed']} articles, "
@@ -294,8 +469,10 @@ Return JSON with: hotels (name, city, state), companies (name, role), contacts (
         if not articles_batch:
             return []
 
-        # Build batch prompt
-        batch_prompt = self.instructions + "\n\nExtract entities from these articles:\n\n"
+        # Build the per-batch tail as a joined list (no quadratic string
+        # concatenation) and pass the shared instructions as a separate
+        # content part so the prefix is never re-copied per batch
+        tail_parts = ["\n\nExtract entities from these articles:\n\n"]
 
         for i, article in enumerate(articles_batch, start=1):
             headline = article.get('headline', 'Unknown')
@@ -305,21 +482,38 @@ Return JSON with: hotels (name, city, state), companies (name, role), contacts (
             if not article_text and len(headline) > 200:
                 article_text = headline
 
-            batch_prompt += f"ARTICLE {i}:\n"
-            batch_prompt += f"Headline: {headline}\n"
-            batch_prompt += f"Text: {article_text}\n\n"
+            tail_parts.append(f"ARTICLE {i}:\nHeadline: {headline}\nText: {article_text}\n\n")
 
-        batch_prompt += f"\nIMPORTANT: If an article is about a DEVELOPMENT/CONSTRUCTION project (not an operating hotel), return hotels: [] for that article.\n"
-        batch_prompt += f"Return a JSON array of {len(articles_batch)} objects, one per article, in the same order."
+        tail_parts.append("\nIMPORTANT: If an article is about a DEVELOPMENT/CONSTRUCTION project (not an operating hotel), return hotels: [] for that article.\n")
+        tail_parts.append(f"Return a JSON array of {len(articles_batch)} objects, one per article, in the same order.")
+
+        batch_prompt = [self.instructions, "".join(tail_parts)]
 
         try:
-            response = self.model.generate_content(
-                batch_prompt,
-                generation_config=genai.GenerationConfig(
-                    response_mime_type="application/json",
-                    response_schema=list[ArticleEntities]
-                )
-            )
+            # Retry rate-limited calls with jittered exponential backoff;
+            # other errors fall straight through to the failure handling
+            for attempt in range(self.MAX_RETRIES):
+                try:
+                    response = self.model.generate_content(
+                        batch_prompt,
+                        generation_config=genai.GenerationConfig(
+                            response_mime_type="application/json",
+                            response_schema=list[ArticleEntities]
+                        )
+                    )
+                    break
+                except Exception as e:
+                    if '429' not in str(e) or attempt >= self.MAX_RETRIES - 1:
+                        raise
+                    delay = min(
+                        self.RETRY_MAX_DELAY,
+                        self.RETRY_BASE_DELAY * (2 ** attempt) + random.uniform(0, 1)
+                    )
+                    self.logger.warning(
+                        f"Rate limited on batch of {len(articles_batch)} articles, "
+                        f"retrying in {delay:.1f}s (attempt {attempt + 1}/{self.MAX_RETRIES})"
+                    )
+                    time.sleep(delay)
 
             if not response.text or not response.text.strip():
                 self.logger.warning(f"Empty response for batch of {len(articles_batch)} articles")
@@ -329,11 +523,12 @@ Return JSON with: hotels (name, city, state), companies (name, role), contacts (
                     for article in articles_batch
                 ]
 
-            entities_list = json.loads(response.text)
+            entities_list = _loads(response.text)
 
             if not isinstance(entities_list, list):
                 self.logger.error(f"Unexpected response format (not a list) for batch")
-                self.stats["failed_processing"] += len(articles_batch)
+                with self._lock:
+                    self.stats["failed_processing"] += len(articles_batch)
                 return [
                     {**article, "hotels": [], "companies": [], "contacts": []}
                     for article in articles_batch
@@ -349,10 +544,13 @@ Return JSON with: hotels (name, city, state), companies (name, role), contacts (
                     contacts = entities.get('contacts', [])
 
                     # Update statistics
-                    self.stats["articles_processed"] += 1
-                    self.stats["hotels_extracted"] += len(hotels)
-                    self.stats["companies_extracted"] += len(companies)
-                    self.stats["contacts_extracted"] += len(contacts)
+                    with self._lock:
+                        self.stats.update({
+                            "articles_processed": 1,
+                            "hotels_extracted": len(hotels),
+                            "companies_extracted": len(companies),
+                            "contacts_extracted": len(contacts)
+                        })
 
                     headline = article.get('headline', 'Unknown')
                     self.logger.info(
@@ -360,6 +558,8 @@ Return JSON with: hotels (name, city, state), companies (name, role), contacts (
                         f"{len(hotels)} hotels, {len(companies)} companies, {len(contacts)} contacts"
                     )
 
+                    self._cache_entities(article, hotels, companies, contacts)
+
                     results.append({
                         **article,
                         "hotels": hotels,
@@ -369,7 +569,8 @@ Return JSON with: hotels (name, city, state), companies (name, role), contacts (
                 else:
                     # Missing response for this article
                     self.logger.warning(f"Missing entity data for article {i + 1} in batch")
-                    self.stats["failed_processing"] += 1
+                    with self._lock:
+                        self.stats["failed_processing"] += 1
                     results.append({
                         **article,
                         "hotels": [],
@@ -382,7 +583,8 @@ Return JSON with: hotels (name, city, state), companies (name, role), contacts (
         except json.JSONDecodeError as e:
             self.logger.error(f"JSON parsing error for batch: {e}")
             self.logger.error(traceback.format_exc())
-            self.stats["failed_processing"] += len(articles_batch)
+            with self._lock:
+                self.stats["failed_processing"] += len(articles_batch)
             return [
                 {**article, "hotels": [], "companies": [], "contacts": []}
                 for article in articles_batch
@@ -391,7 +593,8 @@ Return JSON with: hotels (name, city, state), companies (name, role), contacts (
         except Exception as e:
             self.logger.error(f"Error extracting entities from batch: {e}")
             self.logger.error(traceback.format_exc())
-            self.stats["failed_processing"] += len(articles_batch)
+            with self._lock:
+                self.stats["failed_processing"] += len(articles_batch)
             return [
                 {**article, "hotels": [], "companies": [], "contacts": []}
                 for article in articles_batch
@@ -402,16 +605,25 @@ Return JSON with: hotels (name, city, state), companies (name, role), contacts (
         return self.stats.copy()
 
 
+@functools.lru_cache(maxsize=1)
+def _default_extractor():
+    """Lazily built extractor shared by the convenience function."""
+    return EntityExtractor()
+
+
 # Convenience function
 def extract_article_entities(article):
     """
     Convenience function to extract entities from a single article.
 
+    Reuses a module-level extractor, so repeated calls skip the dotenv,
+    Gemini configuration, instructions-file, and logger setup and share
+    one entity cache.
+
     Args:
         article: Dict with 'article_text' and 'headline'
 
     Returns:
         Article dict with 'hotels', 'companies', 'contacts' lists added
     """
-    extractor = EntityExtractor()
-    return extractor.extract_entities(article)
+    return _default_extractor().extract_entities(article)
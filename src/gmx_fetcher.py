@@ -307,21 +307,33 @@ class GmxFetcher:
 
         return body_text, body_html
 
-    def fetch_stored_emails(self, days_back=1, limit=10, sender_filter=None):
+    def iter_stored_emails(self, days_back=1, limit=10, sender_filter=None):
         """
-        Fetch emails from GMX inbox.
+        Fetch emails from GMX inbox, yielding each as it arrives.
+
+        Yielding per message lets a consumer start parsing while later
+        messages are still in flight on the IMAP connection, and keeps
+        peak memory at one message instead of the full fetch.
 
         Args:
             days_back: Number of days to look back for emails
             limit: Maximum number of emails to fetch
             sender_filter: Optional list of sender email addresses to filter by
 
-        Returns:
-            List of tuples: (from_, subject, date, body_text, body_html)
+        Yields:
+            Tuples of (from_, subject, date, body_text, body_html)
         """
         self.logger.info(f"Fetching emails from GMX (days_back={days_back}, limit={limit})")
 
-        emails = []
+        # One alternation regex over all allowed senders: each From
+        # header is scanned once instead of once per filter entry
+        sender_re = None
+        if sender_filter:
+            sender_re = re.compile(
+                '|'.join(map(re.escape, sender_filter)), re.IGNORECASE
+            )
+
+        fetched = 0
 
         try:
             mail = self._connect_to_imap()
@@ -334,14 +346,13 @@ class GmxFetcher:
 
             if status != "OK":
                 self.logger.error("Failed to search emails")
-                return []
+                return
 
             email_ids = messages[0].split()
             email_ids.reverse()
 
-            count = 0
             for email_id in email_ids:
-                if count >= limit:
+                if fetched >= limit:
                     break
 
                 try:
@@ -355,15 +366,9 @@ class GmxFetcher:
                     from_ = self._decode_header_value(msg.get("From", ""))
                     subject = self._decode_header_value(msg.get("Subject", ""))
 
-                    if sender_filter:
-                        sender_match = False
-                        for allowed_sender in sender_filter:
-                            if allowed_sender.lower() in from_.lower():
-                                sender_match = True
-                                break
-                        if not sender_match:
-                            self.logger.debug(f"Skipping email from {from_} - not in sender filter")
-                            continue
+                    if sender_re is not None and not sender_re.search(from_):
+                        self.logger.debug(f"Skipping email from {from_} - not in sender filter")
+                        continue
 
                     # Get body first so we can parse it for original dates
                     body_text, body_html = self._get_email_body(msg)
@@ -371,10 +376,9 @@ class GmxFetcher:
                     # Extract earliest date (handles forwarded emails)
                     date = self._get_earliest_date(msg, body_text)
 
-                    emails.append((from_, subject, date, body_text, body_html))
                     self.logger.info(f"Fetched email: {subject[:50]}...")
-
-                    count += 1
+                    fetched += 1
+                    yield (from_, subject, date, body_text, body_html)
 
                 except Exception as e:
                     self.logger.error(f"Error processing email {email_id}: {e}")
@@ -385,13 +389,30 @@ class GmxFetcher:
 
         except imaplib.IMAP4.error as e:
             self.logger.error(f"IMAP error: {e}")
-            return []
+            return
         except Exception as e:
             self.logger.error(f"Error connecting to GMX: {e}")
-            return []
+            return
+
+        self.logger.info(f"Successfully fetched {fetched} emails")
 
-        self.logger.info(f"Successfully fetched {len(emails)} emails")
-        return emails
+    def fetch_stored_emails(self, days_back=1, limit=10, sender_filter=None):
+        """
+        Fetch emails from GMX inbox.
+
+        Args:
+            days_back: Number of days to look back for emails
+            limit: Maximum number of emails to fetch
+            sender_filter: Optional list of sender email addresses to filter by
+
+        Returns:
+            List of tuples: (from_, subject, date, body_text, body_html)
+        """
+        return list(self.iter_stored_emails(
+            days_back=days_back,
+            limit=limit,
+            sender_filter=sender_filter
+        ))
 
     def fetch_emails_by_recipient(self, recipient, days_back=1, limit=10):
         """
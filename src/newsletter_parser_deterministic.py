@@ -8,10 +8,58 @@ Much faster than AI-based parsing (~50-150x speed improvement).
 import os
 import re
 import logging
+import concurrent.futures
 from datetime import datetime
 import typing_extensions as typing
 
 
+# Patterns compiled once at import so per-newsletter parsing pays no
+# compile cost
+
+# Patterns for filtering footer content
+_FOOTER_PATTERNS = [
+    r"Did someone forward",
+    r"Pick Your Subscription",
+    r"Make Sure Your",
+    r"Manage preferences",
+    r"Skift,",
+    r"Hotel and Lodging Performance",
+    r"https?://[^\s]+\.(jpg|jpeg|png|gif)",  # Image URLs
+    r"View this email in your browser",
+    r"Unsubscribe from this list",
+    r"Update subscription preferences"
+]
+
+# Single combined regex so each paragraph is scanned in one pass
+# instead of once per pattern
+_FOOTER_RE = re.compile(
+    "|".join(f"(?:{pattern})" for pattern in _FOOTER_PATTERNS),
+    re.IGNORECASE
+)
+
+# First sentence of an article, used for headline generation
+_FIRST_SENTENCE_RE = re.compile(r'^([^.!?]+[.!?])')
+
+# Start-of-content markers
+_START_MARKER_RE = re.compile(r"Daily Lodging Report for\s+\w+\s+\d{1,2},\s+\d{4}", re.IGNORECASE)
+_START_MARKER_SIMPLE_RE = re.compile(r"Daily Lodging Report", re.IGNORECASE)
+
+# Article separator: blank line between paragraphs
+_PARAGRAPH_SPLIT_RE = re.compile(r'\n\s*\n')
+
+
+def _available_cpus():
+    """CPUs actually available to this process, not the machine total.
+
+    Under containers or CPU affinity masks os.cpu_count() overstates the
+    usable cores, which oversubscribes the pool and thrashes caches.
+    """
+    try:
+        return len(os.sched_getaffinity(0)) or 1
+    except AttributeError:
+        return os.cpu_count() or 1
+
+
 class ArticleInfo(typing.TypedDict):
     """Schema for a parsed article."""
     article_number: int
@@ -22,6 +70,10 @@ class ArticleInfo(typing.TypedDict):
 class DeterministicNewsletterParser:
     """Fast pattern-based parser for Daily Lodging Report newsletters."""
 
+    # Newsletters at or above this count fan out across a process pool;
+    # below it the pool startup costs more than the parse
+    PARALLEL_THRESHOLD = 4
+
     def __init__(self, logger=None):
         """
         Initialize the Deterministic Newsletter Parser.
@@ -39,26 +91,16 @@ class DeterministicNewsletterParser:
             "failed_newsletters": []
         }
 
-        # Patterns for filtering footer content
-        self.footer_patterns = [
-            r"Did someone forward",
-            r"Pick Your Subscription",
-            r"Make Sure Your",
-            r"Manage preferences",
-            r"Skift,",
-            r"Hotel and Lodging Performance",
-            r"https?://[^\s]+\.(jpg|jpeg|png|gif)",  # Image URLs
-            r"View this email in your browser",
-            r"Unsubscribe from this list",
-            r"Update subscription preferences"
-        ]
+        # Footer patterns are compiled once at module import
+        self.footer_patterns = _FOOTER_PATTERNS
+        self._footer_regex = _FOOTER_RE
 
         # Section headers to skip when standalone
-        self.section_headers = [
+        self.section_headers = frozenset([
             "Personnel News",
             "Market Update",
             "Industry News"
-        ]
+        ])
 
     def _setup_logging(self):
         """Set up logging for the parser."""
@@ -79,10 +121,7 @@ class DeterministicNewsletterParser:
 
     def _is_footer_content(self, text):
         """Check if text matches footer patterns."""
-        for pattern in self.footer_patterns:
-            if re.search(pattern, text, re.IGNORECASE):
-                return True
-        return False
+        return self._footer_regex.search(text) is not None
 
     def _is_section_header(self, text):
         """Check if text is a standalone section header."""
@@ -101,7 +140,7 @@ class DeterministicNewsletterParser:
             return "Unknown Article"
 
         # Try to get first sentence (up to first period, exclamation, or question mark)
-        sentence_match = re.match(r'^([^.!?]+[.!?])', article_text)
+        sentence_match = _FIRST_SENTENCE_RE.match(article_text)
         if sentence_match:
             headline = sentence_match.group(1).strip()
             if len(headline) <= 150:
@@ -120,15 +159,13 @@ class DeterministicNewsletterParser:
         Returns the index after "Daily Lodging Report for [DATE]"
         """
         # Look for the start marker
-        pattern = r"Daily Lodging Report for\s+\w+\s+\d{1,2},\s+\d{4}"
-        match = re.search(pattern, body_text, re.IGNORECASE)
+        match = _START_MARKER_RE.search(body_text)
 
         if match:
             return match.end()
 
         # Fallback: try simpler pattern
-        pattern_simple = r"Daily Lodging Report"
-        match_simple = re.search(pattern_simple, body_text, re.IGNORECASE)
+        match_simple = _START_MARKER_SIMPLE_RE.search(body_text)
 
         if match_simple:
             return match_simple.end()
@@ -213,7 +250,7 @@ class DeterministicNewsletterParser:
             content = body[start_pos:]
 
             # Step 2: Split by double newlines (article separator)
-            paragraphs = re.split(r'\n\s*\n', content)
+            paragraphs = _PARAGRAPH_SPLIT_RE.split(content)
 
             # Clean up paragraphs (strip whitespace)
             paragraphs = [p.strip() for p in paragraphs if p.strip()]
@@ -269,17 +306,37 @@ class DeterministicNewsletterParser:
         """
         Parse multiple newsletter emails.
 
+        Each newsletter is independent and the pattern matching is pure
+        CPU, so batches of PARALLEL_THRESHOLD or more fan out across a
+        process pool (same approach as ArticlePreparator). Workers send
+        back per-newsletter stats deltas that are folded into self.stats,
+        so get_stats() is unchanged either way.
+
         Args:
-            emails: List of tuples (from_, subject, date, body_text, body_html)
+            emails: Iterable of tuples (from_, subject, date, body_text, body_html)
 
         Returns:
             List of all extracted articles
         """
+        # Accept generators (e.g. GmxFetcher.iter_stored_emails); the
+        # threshold check and chunksize math below both need a length
+        emails = list(emails)
         all_articles = []
 
-        for from_, subject, date, body_text, body_html in emails:
-            articles = self.parse_newsletter(from_, subject, date, body_text, body_html)
-            all_articles.extend(articles)
+        if len(emails) < self.PARALLEL_THRESHOLD:
+            for from_, subject, date, body_text, body_html in emails:
+                articles = self.parse_newsletter(from_, subject, date, body_text, body_html)
+                all_articles.extend(articles)
+        else:
+            workers = _available_cpus()
+            chunksize = max(1, len(emails) // (4 * workers))
+            with concurrent.futures.ProcessPoolExecutor(max_workers=workers) as executor:
+                for articles, stats in executor.map(_parse_one, emails, chunksize=chunksize):
+                    all_articles.extend(articles)
+                    self.stats["newsletters_processed"] += stats["newsletters_processed"]
+                    self.stats["articles_extracted"] += stats["articles_extracted"]
+                    self.stats["failed_processing"] += stats["failed_processing"]
+                    self.stats["failed_newsletters"].extend(stats["failed_newsletters"])
 
         self.logger.info(f"Total articles extracted: {len(all_articles)} from {len(emails)} newsletters")
         return all_articles
@@ -289,6 +346,36 @@ class DeterministicNewsletterParser:
         return self.stats.copy()
 
 
+# Per-process parser reused across _parse_one calls, so each pool worker
+# builds its logger and state once instead of per email
+_WORKER_PARSER = None
+
+
+def _parse_one(email):
+    """
+    Pool worker: parse one newsletter and report its stats delta.
+
+    Args:
+        email: Tuple of (from_, subject, date, body_text, body_html)
+
+    Returns:
+        Tuple of (articles, stats) where stats covers just this email
+    """
+    global _WORKER_PARSER
+    if _WORKER_PARSER is None:
+        _WORKER_PARSER = DeterministicNewsletterParser()
+
+    # Reset so the returned stats are this email's delta only
+    _WORKER_PARSER.stats = {
+        "newsletters_processed": 0,
+        "articles_extracted": 0,
+        "failed_processing": 0,
+        "failed_newsletters": []
+    }
+    articles = _WORKER_PARSER.parse_newsletter(*email)
+    return articles, _WORKER_PARSER.stats
+
+
 # Convenience function
 def parse_newsletter_email(from_, subject, date, body_text, body_html=None):
     """
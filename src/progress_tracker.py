@@ -25,8 +25,13 @@ class ProgressTracker:
             logger: Optional logger instance
         """
         self.checkpoint_path = checkpoint_path
+        self.journal_path = checkpoint_path + '.journal'
         self.logger = logger or self._setup_logging()
         self.checkpoint_data = self._initialize_checkpoint()
+        self._journal_file = None
+        # Normalized processed paths, kept in sync with checkpoint_data so
+        # membership checks are O(1) instead of scanning the path list
+        self._processed_set = set()
 
     def _setup_logging(self):
         """Set up logging for the progress tracker."""
@@ -79,6 +84,8 @@ class ProgressTracker:
                 with open(self.checkpoint_path, 'r', encoding='utf-8') as f:
                     data = json.load(f)
                 self.checkpoint_data = data
+                self._rebuild_processed_set()
+                self._replay_journal()
                 self.logger.info(f"Loaded checkpoint: {self.checkpoint_data['processed_files']}/{self.checkpoint_data['total_files']} files processed")
                 return data
             except Exception as e:
@@ -86,7 +93,93 @@ class ProgressTracker:
                 return self._initialize_checkpoint()
         else:
             self.logger.info("No checkpoint found, starting fresh")
-            return self._initialize_checkpoint()
+            self._replay_journal()
+            return self.checkpoint_data
+
+    def _rebuild_processed_set(self):
+        """Rebuild the normalized processed-path set from checkpoint data."""
+        self._processed_set = {
+            os.path.normpath(p)
+            for p in self.checkpoint_data.get('processed_file_paths', [])
+        }
+
+    def _replay_journal(self):
+        """
+        Replay journal entries written since the last full snapshot.
+
+        The journal holds paths processed after the snapshot was taken, so
+        they are merged back into the checkpoint data on load.
+        """
+        if not os.path.exists(self.journal_path):
+            return
+
+        replayed = 0
+
+        try:
+            with open(self.journal_path, 'r', encoding='utf-8') as f:
+                for line in f:
+                    line = line.strip()
+                    if not line:
+                        continue
+                    record = json.loads(line)
+                    for path in record.get('processed', []):
+                        normalized = os.path.normpath(path)
+                        if normalized not in self._processed_set:
+                            self._processed_set.add(normalized)
+                            self.checkpoint_data['processed_file_paths'].append(path)
+                            replayed += 1
+
+            self.checkpoint_data['processed_files'] = len(self.checkpoint_data['processed_file_paths'])
+
+            if replayed:
+                self.logger.info(f"Replayed {replayed} processed files from checkpoint journal")
+
+        except Exception as e:
+            self.logger.error(f"Failed to replay checkpoint journal: {e}")
+
+    def append_processed_batch(self, paths: List[str]):
+        """
+        Append newly processed paths to the journal without rewriting the
+        full checkpoint snapshot.
+
+        Args:
+            paths: File paths processed since the last journal write
+        """
+        if not paths:
+            return
+
+        try:
+            if self._journal_file is None:
+                os.makedirs(os.path.dirname(self.journal_path) or '.', exist_ok=True)
+                self._journal_file = open(self.journal_path, 'a', encoding='utf-8')
+
+            record = {
+                "processed": list(paths),
+                "timestamp": datetime.now().isoformat()
+            }
+            self._journal_file.write(json.dumps(record, ensure_ascii=False) + '\n')
+            self._journal_file.flush()
+            os.fsync(self._journal_file.fileno())
+
+            self.logger.debug(f"Journaled {len(paths)} processed files")
+
+        except Exception as e:
+            self.logger.error(f"Failed to append to checkpoint journal: {e}")
+
+    def _truncate_journal(self):
+        """Discard the journal after its contents are captured in a snapshot."""
+        if self._journal_file is not None:
+            try:
+                self._journal_file.close()
+            except Exception:
+                pass
+            self._journal_file = None
+
+        if os.path.exists(self.journal_path):
+            try:
+                os.remove(self.journal_path)
+            except OSError as e:
+                self.logger.warning(f"Failed to remove checkpoint journal: {e}")
 
     def save_checkpoint(self, data: Dict[str, Any] = None):
         """
@@ -97,6 +190,7 @@ class ProgressTracker:
         """
         if data:
             self.checkpoint_data = data
+            self._rebuild_processed_set()
 
         # Update timestamp
         self.checkpoint_data['last_updated'] = datetime.now().isoformat()
@@ -119,6 +213,9 @@ class ProgressTracker:
             # Atomic rename
             shutil.move(tmp_path, self.checkpoint_path)
 
+            # Snapshot now holds everything the journal recorded
+            self._truncate_journal()
+
             self.logger.debug(f"Saved checkpoint: {self.checkpoint_data['processed_files']}/{self.checkpoint_data['total_files']} files")
 
         except Exception as e:
@@ -140,10 +237,8 @@ class ProgressTracker:
         Returns:
             True if file has been processed
         """
-        # Normalize path for comparison
-        normalized_path = os.path.normpath(file_path)
-        processed_paths = [os.path.normpath(p) for p in self.checkpoint_data.get('processed_file_paths', [])]
-        return normalized_path in processed_paths
+        # Normalize path for comparison; set lookup keeps this O(1)
+        return os.path.normpath(file_path) in self._processed_set
 
     def mark_processed(self, file_path: str):
         """
@@ -152,7 +247,9 @@ class ProgressTracker:
         Args:
             file_path: File path to mark
         """
-        if not self.is_processed(file_path):
+        normalized = os.path.normpath(file_path)
+        if normalized not in self._processed_set:
+            self._processed_set.add(normalized)
             self.checkpoint_data['processed_file_paths'].append(file_path)
             self.checkpoint_data['processed_files'] = len(self.checkpoint_data['processed_file_paths'])
 
@@ -181,7 +278,7 @@ class ProgressTracker:
         Returns:
             List of unprocessed file paths
         """
-        processed_paths = set(os.path.normpath(p) for p in self.checkpoint_data.get('processed_file_paths', []))
+        processed_paths = self._processed_set
         remaining = [f for f in all_files if os.path.normpath(f) not in processed_paths]
 
         self.logger.info(f"Remaining files: {len(remaining)}/{len(all_files)}")
@@ -211,6 +308,8 @@ class ProgressTracker:
     def reset(self):
         """Reset checkpoint to initial state."""
         self.checkpoint_data = self._initialize_checkpoint()
+        self._processed_set = set()
+        self._truncate_journal()
         self.logger.info("Checkpoint reset")
 
 
@@ -0,0 +1,162 @@
+"""
+Validation Cache for DLRScanner
+
+SQLite-backed cache of entity validation results. Hotel, company, and
+contact names recur heavily across daily newsletters; caching their
+resolved entry IDs (including misses) lets repeat runs skip validation
+for entities seen within the TTL window.
+"""
+
+import os
+import time
+import logging
+import sqlite3
+import threading
+from datetime import datetime
+
+# Default cache location and freshness window (hours, via env)
+DEFAULT_CACHE_PATH = os.path.join('data', 'validation_cache.db')
+DEFAULT_TTL_HOURS = 24.0
+
+# SQLite limits the number of bound variables per statement; stay well
+# under the historical 999 default
+_QUERY_CHUNK = 500
+
+
+class ValidationCache:
+    """Persistent (kind, name) -> entry_id cache with TTL expiry."""
+
+    def __init__(self, cache_path=None, ttl_hours=None, logger=None):
+        """
+        Initialize the validation cache.
+
+        Args:
+            cache_path: Path to the SQLite file (default: data/validation_cache.db)
+            ttl_hours: Result freshness window in hours (default from
+                VALIDATION_CACHE_TTL_HOURS env var or 24)
+            logger: Optional logger instance
+        """
+        self.logger = logger or self._setup_logging()
+        self.cache_path = cache_path or DEFAULT_CACHE_PATH
+
+        if ttl_hours is None:
+            ttl_hours = float(os.getenv('VALIDATION_CACHE_TTL_HOURS', str(DEFAULT_TTL_HOURS)))
+        self.ttl_seconds = ttl_hours * 3600
+
+        # One connection shared across threads, serialized by the lock
+        self._lock = threading.Lock()
+        os.makedirs(os.path.dirname(self.cache_path) or '.', exist_ok=True)
+        self._conn = sqlite3.connect(self.cache_path, check_same_thread=False)
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS entities ("
+            " kind TEXT NOT NULL,"
+            " name_norm TEXT NOT NULL,"
+            " entry_id INTEGER,"
+            " fetched_at REAL NOT NULL,"
+            " PRIMARY KEY (kind, name_norm))"
+        )
+        self._conn.commit()
+
+    def _setup_logging(self):
+        """Set up logging for the validation cache."""
+        today = datetime.now().strftime("%Y%m%d")
+
+        logger = logging.getLogger('validation_cache')
+        logger.setLevel(logging.INFO)
+
+        if not logger.handlers:
+            os.makedirs("logs", exist_ok=True)
+
+            formatter = logging.Formatter('%(asctime)s - %(levelname)s - %(message)s')
+            file_handler = logging.FileHandler(f"logs/validation_cache_{today}.log")
+            file_handler.setFormatter(formatter)
+            logger.addHandler(file_handler)
+
+        return logger
+
+    @staticmethod
+    def normalize(name):
+        """Normalize an entity name for use as a cache key."""
+        return name.casefold().strip()
+
+    def get_many(self, kind, names):
+        """
+        Look up cached entry IDs for a batch of normalized names.
+
+        Args:
+            kind: Entity kind ('hotel', 'company', 'contact')
+            names: Iterable of normalized names
+
+        Returns:
+            Dict mapping each fresh cached name to its entry_id (which
+            may be None for a cached miss); names absent from the dict
+            need validation
+        """
+        names = list(names)
+        if not names:
+            return {}
+
+        cutoff = time.time() - self.ttl_seconds
+        found = {}
+        try:
+            with self._lock:
+                for i in range(0, len(names), _QUERY_CHUNK):
+                    chunk = names[i:i + _QUERY_CHUNK]
+                    placeholders = ','.join('?' * len(chunk))
+                    rows = self._conn.execute(
+                        f"SELECT name_norm, entry_id FROM entities"
+                        f" WHERE kind = ? AND fetched_at >= ?"
+                        f" AND name_norm IN ({placeholders})",
+                        [kind, cutoff] + chunk
+                    )
+                    found.update(rows)
+        except sqlite3.Error as e:
+            self.logger.warning(f"Validation cache read failed: {e}")
+            return {}
+
+        return found
+
+    def store_many(self, kind, results):
+        """
+        Store a batch of validation results.
+
+        Args:
+            kind: Entity kind ('hotel', 'company', 'contact')
+            results: Dict mapping normalized name -> entry_id (or None
+                for entities that did not match)
+        """
+        if not results:
+            return
+
+        now = time.time()
+        try:
+            with self._lock:
+                self._conn.executemany(
+                    "INSERT OR REPLACE INTO entities"
+                    " (kind, name_norm, entry_id, fetched_at) VALUES (?, ?, ?, ?)",
+                    [(kind, name, entry_id, now) for name, entry_id in results.items()]
+                )
+                self._conn.commit()
+        except sqlite3.Error as e:
+            self.logger.warning(f"Validation cache write failed: {e}")
+
+    def purge_expired(self):
+        """Delete rows older than the TTL; returns the number removed."""
+        cutoff = time.time() - self.ttl_seconds
+        try:
+            with self._lock:
+                cursor = self._conn.execute(
+                    "DELETE FROM entities WHERE fetched_at < ?", (cutoff,)
+                )
+                self._conn.commit()
+                return cursor.rowcount
+        except sqlite3.Error as e:
+            self.logger.warning(f"Validation cache purge failed: {e}")
+            return 0
+
+    def close(self):
+        """Close the underlying connection."""
+        try:
+            self._conn.close()
+        except sqlite3.Error:
+            pass
@@ -44,6 +44,9 @@ class ValidationOrchestrator:
         self._contact_validator = None
         self._validators_initialized = False
 
+        # Persistent entity cache (loaded lazily; False marks a failed load)
+        self._validation_cache = None
+
     def _setup_logging(self):
         """Set up logging for the orchestrator."""
         today = datetime.now().strftime("%Y%m%d")
@@ -187,6 +190,78 @@ class ValidationOrchestrator:
 
         return validator_results
 
+    def _get_cache(self):
+        """
+        Lazily open the persistent validation cache.
+
+        Returns:
+            ValidationCache instance, or None if it could not be opened
+        """
+        if self._validation_cache is None:
+            try:
+                from validation_cache import ValidationCache
+                self._validation_cache = ValidationCache(logger=self.logger)
+            except Exception as e:
+                self.logger.warning(f"Validation cache unavailable: {e}")
+                self._validation_cache = False
+        return self._validation_cache or None
+
+    def _validate_deduped(self, validator_data, kind, detail_key, id_key, validate_fn):
+        """
+        Run a name-embedding validator once per unique, uncached name.
+
+        The same companies and contacts recur across articles in a daily
+        batch; validating each occurrence separately repeats identical
+        embedding lookups. This gathers the unique detail dicts, serves
+        names seen within the cache TTL from the on-disk cache, validates
+        only the remainder in one synthetic record, and scatters the
+        entry IDs back onto every article by normalized name.
+
+        Args:
+            validator_data: Articles in validator format
+            kind: Entity kind for the persistent cache ('company', 'contact')
+            detail_key: Key holding the detail dicts (e.g. 'company_details')
+            id_key: Key the validator fills with entry IDs
+            validate_fn: Batched validator method taking a list of records
+
+        Returns:
+            validator_data with id_key populated on every record
+        """
+        unique = {}
+        for result in validator_data:
+            for detail in result.get(detail_key, []):
+                key = detail.get("name", "").casefold().strip()
+                if key and key not in unique:
+                    unique[key] = detail
+
+        cache = self._get_cache()
+        id_by_name = cache.get_many(kind, unique) if cache else {}
+        pending = [name for name in unique if name not in id_by_name]
+
+        if id_by_name:
+            self.logger.info(
+                f"Validation cache served {len(id_by_name)}/{len(unique)} unique {kind} names"
+            )
+
+        if pending:
+            self.logger.info(
+                f"Validating {len(pending)} unique {kind} names across {len(validator_data)} articles"
+            )
+            synthetic = [{detail_key: [unique[name] for name in pending]}]
+            validated = validate_fn(synthetic)
+            entry_ids = validated[0].get(id_key, [])
+            fresh = dict(zip(pending, entry_ids))
+            id_by_name.update(fresh)
+            if cache:
+                cache.store_many(kind, fresh)
+
+        for result in validator_data:
+            result[id_key] = [
+                id_by_name.get(d.get("name", "").casefold().strip())
+                for d in result.get(detail_key, [])
+            ]
+        return validator_data
+
     def _map_validation_results(self, validated_results, original_articles):
         """
         Map validation results back to article format.
@@ -265,11 +340,16 @@ class ValidationOrchestrator:
             for result in validator_data:
                 result["Hotel - Entry ID"] = [None] * len(result.get("hotel_details", []))
 
-        # Validate companies
+        # Validate companies (deduplicated: each unique name hits the
+        # embedding validator once, results fan back out per article)
         if self._company_validator:
             try:
-                validator_data = self._company_validator.match_companies_with_embeddings_batched(
-                    validator_data
+                validator_data = self._validate_deduped(
+                    validator_data,
+                    "company",
+                    "company_details",
+                    "Company - Entry ID",
+                    self._company_validator.match_companies_with_embeddings_batched
                 )
                 self.logger.info("Company validation complete")
             except Exception as e:
@@ -284,11 +364,15 @@ class ValidationOrchestrator:
             for result in validator_data:
                 result["Company - Entry ID"] = [None] * len(result.get("company_details", []))
 
-        # Validate contacts
+        # Validate contacts (deduplicated like companies)
         if self._contact_validator:
             try:
-                validator_data = self._contact_validator.match_contacts_with_embeddings_batched(
-                    validator_data
+                validator_data = self._validate_deduped(
+                    validator_data,
+                    "contact",
+                    "contact_details",
+                    "Contact - Entry ID",
+                    self._contact_validator.match_contacts_with_embeddings_batched
                 )
                 self.logger.info("Contact validation complete")
             except Exception as e: